@@ -4,7 +4,7 @@ from PyQt6.QtGui import QFont, QAction, QPalette, QColor, QPixmap
 import os
 import platform
 import subprocess
-from non_png_image import scan_non_png_images, convert_to_png
+from non_png_image import scan_non_png_images, convert_many
 from image_report import scan_images_for_resizing
 from file_numbers import move_file_to_trash
 from markdown_viewer import MarkdownViewer
@@ -34,6 +34,7 @@ class CheckImageSanityWidget(QWidget):
         self.image_files = []
         self.directory_path = ""
         self.mode = None
+        self.is_network = False
         self.button_info_labels = {}
         self.markdown_viewers = []
 
@@ -231,6 +232,7 @@ class CheckImageSanityWidget(QWidget):
         self.image_files = []
         self.directory_path = ""
         self.mode = None
+        self.is_network = False
         self.table.setRowCount(0)
         self.table.setVisible(False)
         self.feedback_label.setText("Select a check to begin")
@@ -341,6 +343,7 @@ class CheckImageSanityWidget(QWidget):
         
         # Check for network drive and warn user
         network_info = get_network_drive_info(self.directory_path)
+        self.is_network = network_info['is_network']
         if network_info['is_network']:
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle("Network Drive Detected")
@@ -369,20 +372,8 @@ class CheckImageSanityWidget(QWidget):
         self.fix_image_btn.setVisible(False)
         self.refresh_btn.setVisible(False)
         try:
-            self.image_files, total_images_scanned, images_to_be_resized = scan_images_for_resizing(self.directory_path)
-            # Filter out images where DPI is approximately 144 but flagged due to floating point
-            filtered_files = []
-            for file_path, relative_path, reason in self.image_files:
-                try:
-                    with Image.open(file_path) as img:
-                        dpi = img.info.get('dpi', (0, 0))
-                        if "DPI" in reason and round(dpi[0]) == 144 and round(dpi[1]) == 144:
-                            continue  # Do not flag
-                        filtered_files.append((file_path, relative_path, reason))
-                except Exception:
-                    filtered_files.append((file_path, relative_path, reason))
-            self.image_files = filtered_files
-            images_to_be_resized = len(self.image_files)
+            # Images whose DPI is 144 up to floating point are already left out by the scan
+            self.image_files, total_images_scanned, images_to_be_resized = scan_images_for_resizing(self.directory_path, is_network=self.is_network)
             for row, (file_path, relative_path, reason) in enumerate(self.image_files):
                 file_name = os.path.basename(file_path)
                 self.add_table_row(file_name, relative_path, reason, file_path)
@@ -422,11 +413,15 @@ class CheckImageSanityWidget(QWidget):
         log_file = os.path.join(legacy_folder, "Log.txt")
         os.makedirs(graphics_folder, exist_ok=True)
         new_image_files = self.image_files.copy()  # Create a copy to avoid modifying list during iteration
-        for row, (file_path, relative_path, reason) in enumerate(self.image_files):
-            if "Converted to PNG" in reason or "Error" in reason:
-                continue
+        pending_rows = [row for row, (_, _, reason) in enumerate(self.image_files)
+                        if "Converted to PNG" not in reason and "Error" not in reason]
+        try:
+            results = convert_many([self.image_files[row][0] for row in pending_rows], parent_dir)
+        except Exception as e:
+            results = [(None, str(e), None)] * len(pending_rows)
+        for row, (new_file_path, error, _) in zip(pending_rows, results):
+            file_path, relative_path, reason = self.image_files[row]
             try:
-                new_file_path, error = convert_to_png(file_path, parent_dir)
                 if error:
                     self.table.setItem(row, 2, QTableWidgetItem(f"Error: {error}"))
                     continue
@@ -441,6 +436,17 @@ class CheckImageSanityWidget(QWidget):
                 converted_count += 1
             except Exception as e:
                 self.table.setItem(row, 2, QTableWidgetItem(f"Error: {str(e)}"))
+        # Log every conversion of the batch in a single append
+        log_lines = [log_line for _, _, log_line in results if log_line]
+        if log_lines:
+            try:
+                with open(log_file, "a", encoding="utf-8") as f:
+                    if CheckImageSanityWidget.first_conversion:
+                        f.write("--------------\nImages Converted\n")
+                        CheckImageSanityWidget.first_conversion = False
+                    f.writelines(log_lines)
+            except Exception as e:
+                logging.error(f"Error logging conversions to {log_file}: {str(e)}")
         self.image_files = new_image_files  # Update image_files after all conversions
         # Refresh table to update View button connections
         self.table.setRowCount(0)
@@ -1,5 +1,5 @@
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QLabel, QFileDialog, QWidget, QMessageBox
-from PyQt6.QtCore import Qt, QUrl, QEvent
+from PyQt6.QtWidgets import QApplication, QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QLabel, QFileDialog, QWidget, QMessageBox
+from PyQt6.QtCore import Qt, QUrl, QEvent, QThread, pyqtSignal, QFileSystemWatcher
 from PyQt6.QtGui import QFont, QDesktopServices, QPalette, QColor, QPixmap
 from file_numbers import analyze_files, get_files_by_type, move_file_to_trash
 from unreferenced_xmls import find_unreferenced_xmls, move_xml_to_trash
@@ -16,6 +16,53 @@ from network_utils import get_network_drive_info
 # Set up logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def scan_watch_paths(directory_path: str) -> list:
+    # Every folder the unreferenced scans list and every XML they may read, skipping LegacyTextTuring as they do.
+    # Watching folders catches files being added or removed anywhere, watching XMLs catches edited hrefs
+    paths = []
+    for root, dirs, files in os.walk(directory_path):
+        if 'LegacyTextTuring' in root.split(os.sep):
+            dirs[:] = []
+            continue
+        dirs[:] = [d for d in dirs if d != 'LegacyTextTuring']
+        paths.append(root)
+        paths.extend(os.path.join(root, file) for file in files if file.endswith(".xml"))
+    return paths
+
+class UnreferencedGraphicsScanThread(QThread):
+    watch = pyqtSignal(list)
+    batch = pyqtSignal(list)
+    result = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    BATCH_SIZE = 100
+
+    def __init__(self, ditamap_path: str, directory_path: str, parent=None):
+        super().__init__(parent)
+        self.ditamap_path = ditamap_path
+        self.directory_path = directory_path
+        self.is_canceled = False
+
+    def run(self):
+        try:
+            # Listed before scanning, so the UI starts watching before any file is read
+            self.watch.emit(scan_watch_paths(self.directory_path))
+            results = find_unreferenced_graphics(self.ditamap_path, self.directory_path)
+        except Exception as e:
+            if not self.is_canceled:
+                self.error.emit(str(e))
+            return
+        # Deliver rows in batches so the UI thread can paint between them
+        for start in range(0, len(results), self.BATCH_SIZE):
+            if self.is_canceled:
+                return
+            self.batch.emit(results[start:start + self.BATCH_SIZE])
+        if not self.is_canceled:
+            self.result.emit(results)
+
+    def cancel(self):
+        self.is_canceled = True
+
 class FileListDialog(QDialog):
     def __init__(self, directory_path: str, file_type: str, parent=None):
         super().__init__(parent)
@@ -177,8 +224,7 @@ class FileListDialog(QDialog):
             self.feedback_label.setText(f"Showing {len(results)} {self.file_type} files")
             self.delete_all_btn.setEnabled(True)
             self.logger.debug(f"Populated table with {len(results)} files")
-        self.table.resizeColumnsToContents()
-        self.table.setColumnWidth(2, max(110, self.table.columnWidth(2)))
+        self.table.setColumnWidth(2, 110)
 
     def handle_delete(self, row: int):
         if self.is_deleting:
@@ -259,6 +305,7 @@ class FileListDialog(QDialog):
     def accept(self):
         self.logger.debug("Accepting FileListDialog, resetting parent")
         if self.parent_widget:
+            self.parent_widget.cancel_graphics_scan()
             self.parent_widget.directory_path = ""
             self.parent_widget.current_mode = ""
             self.parent_widget.refresh_table()
@@ -276,6 +323,20 @@ class FileSanityWidget(QWidget):
         self.current_mode = ""
         self.button_info_labels = {}
         self.markdown_viewers = []
+        self.graphics_scan_thread = None
+        self.graphics_scan_key = None
+        # Unreferenced-file scan results keyed by (mode, ditamap, directory, ditamap mtime). The watcher covers every
+        # folder and XML a scan reads and clears the cache on any change; the generation counts those clears, so a
+        # scan that was running during one does not store its possibly stale result
+        self.scan_cache = {}
+        self.scan_cache_generation = 0
+        self.graphics_scan_generation = 0
+        self.scan_watcher = QFileSystemWatcher(self)
+        self.scan_watcher.fileChanged.connect(self.invalidate_scan_cache)
+        self.scan_watcher.directoryChanged.connect(self.invalidate_scan_cache)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_graphics_scans)
         self.setAutoFillBackground(True)
         palette = self.palette()
         palette.setColor(QPalette.ColorRole.Base, QColor("#1F252A"))
@@ -534,6 +595,7 @@ class FileSanityWidget(QWidget):
             self.feedback_label.setVisible(True)
             self.logger.debug("No directory selected")
             return
+        self.cancel_graphics_scan()
         self.directory_path = selected_dir
         self.current_mode = "delete_unnecessary"
         self.delete_all_btn.setVisible(True)
@@ -548,8 +610,7 @@ class FileSanityWidget(QWidget):
             self.feedback_label.setVisible(True)
             self.logger.debug("No directory selected")
             return
-        self.current_mode
-
+        self.cancel_graphics_scan()
         self.current_mode = "file_analytics"
         self.delete_all_btn.setVisible(False)
         self.refresh_table()
@@ -611,8 +672,7 @@ class FileSanityWidget(QWidget):
                 self.table.setVisible(True)
                 self.feedback_label.setVisible(True)
                 self.logger.debug(f"Populated table with {len(results)} rows, {total_files} total files")
-            self.table.resizeColumnsToContents()
-            self.table.setColumnWidth(2, max(110, self.table.columnWidth(2)))
+            self.table.setColumnWidth(2, 110)
             self.table.viewport().update()  # Force UI redraw
         except Exception as e:
             self.feedback_label.setText(f"Error: {str(e)}")
@@ -750,6 +810,36 @@ class FileSanityWidget(QWidget):
         elif self.current_mode in ["unreferenced_xmls", "unreferenced_graphics"]:
             self.handle_delete_all_unreferenced()
 
+    def unreferenced_scan_key(self, mode: str):
+        try:
+            mtime = os.path.getmtime(self.selected_ditamap)
+        except OSError:
+            return None
+        return (mode, self.selected_ditamap, self.directory_path, mtime)
+
+    def watch_scan_inputs(self, paths: list):
+        watched = set(self.scan_watcher.files()) | set(self.scan_watcher.directories())
+        new_paths = [path for path in [self.selected_ditamap] + paths if path not in watched and os.path.exists(path)]
+        if new_paths:
+            self.scan_watcher.addPaths(new_paths)
+
+    def invalidate_scan_cache(self, *args):
+        self.logger.debug("Invalidating unreferenced scan cache")
+        self.scan_cache.clear()
+        self.scan_cache_generation += 1
+
+    def cached_unreferenced_xmls(self) -> list:
+        key = self.unreferenced_scan_key("unreferenced_xmls")
+        results = self.scan_cache.get(key) if key else None
+        if results is None:
+            # Watched before scanning; changes during the scan are delivered once control returns to the event loop
+            # and clear the entry stored here
+            self.watch_scan_inputs(scan_watch_paths(self.directory_path))
+            results = find_unreferenced_xmls(self.selected_ditamap, self.directory_path)
+            if key:
+                self.scan_cache[key] = results
+        return results
+
     def handle_check_unreferenced_xmls(self):
         self.logger.debug("Handling Check Unreferenced XMLs")
         ditamap_path, _ = QFileDialog.getOpenFileName(
@@ -764,6 +854,7 @@ class FileSanityWidget(QWidget):
             self.feedback_label.setVisible(True)
             self.logger.debug("No DITA MAP file selected")
             return
+        self.cancel_graphics_scan()
         self.directory_path = str(Path(ditamap_path).parent)
         self.selected_ditamap = ditamap_path
         self.current_mode = "unreferenced_xmls"
@@ -771,7 +862,7 @@ class FileSanityWidget(QWidget):
         self.table.setHorizontalHeaderLabels(["File Name", "Folder Path", "Action"])
         self.table.setRowCount(0)
         try:
-            results = find_unreferenced_xmls(self.selected_ditamap, self.directory_path)
+            results = self.cached_unreferenced_xmls()
             if not results:
                 self.feedback_label.setText("No unreferenced XML files found")
                 self.table.setVisible(False)
@@ -821,7 +912,7 @@ class FileSanityWidget(QWidget):
                             border: 1px solid #555555;
                         }
                     """)
-                    delete_btn.clicked.connect(lambda _, r=row: self.handle_delete_unreferenced(r))
+                    delete_btn.clicked.connect(self.handle_unreferenced_delete_clicked)
                     self.table.setCellWidget(row, 2, delete_btn)
                 self.feedback_label.setText(f"Found {len(results)} unreferenced XML files")
                 self.table.setVisible(True)
@@ -834,8 +925,7 @@ class FileSanityWidget(QWidget):
             self.feedback_label.setVisible(True)
             self.delete_all_btn.setEnabled(False)
             self.logger.error(f"Error checking unreferenced XMLs: {str(e)}")
-        self.table.resizeColumnsToContents()
-        self.table.setColumnWidth(2, max(110, self.table.columnWidth(2)))
+        self.table.setColumnWidth(2, 110)
 
     def handle_check_unreferenced_graphics(self):
         self.logger.debug("Handling Check Unreferenced Graphics")
@@ -870,76 +960,19 @@ class FileSanityWidget(QWidget):
                 return
         
         self.selected_ditamap = ditamap_path
-        self.current_mode = "unreferenced_graphics"
-        self.delete_all_btn.setVisible(True)
-        self.table.setHorizontalHeaderLabels(["File Name", "Folder Path", "Action"])
-        self.table.setRowCount(0)
-        try:
-            results = find_unreferenced_graphics(self.selected_ditamap, self.directory_path)
-            if not results:
-                self.feedback_label.setText("No unreferenced graphics files found")
-                self.table.setVisible(False)
-                self.feedback_label.setVisible(True)
-                self.delete_all_btn.setEnabled(False)
-                self.logger.debug("No unreferenced graphics files found")
-            else:
-                for row, (file_name, folder_path, status) in enumerate(results):
-                    self.table.insertRow(row)
-                    full_path = os.path.join(self.directory_path, folder_path, file_name)
-                    file_url = QUrl.fromLocalFile(full_path).toString()
-                    file_link_label = QLabel()
-                    file_link_label.setText(f'<a href="{file_url}" style="color: #0000FF; text-decoration: underline;">{file_name}</a>')
-                    file_link_label.setStyleSheet("background-color: #E6ECEF;")
-                    file_link_label.setOpenExternalLinks(True)
-                    file_link_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
-                    self.table.setCellWidget(row, 0, file_link_label)
-                    folder_full_path = os.path.join(self.directory_path, folder_path)
-                    folder_url = QUrl.fromLocalFile(folder_full_path).toString()
-                    folder_link_label = QLabel()
-                    folder_link_label.setText(f'<a href="{folder_url}" style="color: #0000FF; text-decoration: underline;">{folder_path}</a>')
-                    file_link_label.setStyleSheet("background-color: #E6ECEF;")
-                    folder_link_label.setOpenExternalLinks(True)
-                    folder_link_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
-                    self.table.setCellWidget(row, 1, folder_link_label)
-                    delete_btn = QPushButton("Delete")
-                    delete_btn.setFont(QFont("Helvetica", 9))
-                    delete_btn.setMinimumSize(48, 18)
-                    delete_btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #FF8C00;
-                            color: #FFFFFF;
-                            padding: 1px 2px;
-                            border-radius: 4px;
-                            border: 1px solid #CC7000;
-                            box-shadow: none;
-                            min-width: 48px;
-                            min-height: 18px;
-                            text-align: center;
-                        }
-                        QPushButton:hover {
-                            background-color: #FFA500;
-                            border: 1px solid #CC8400;
-                        }
-                        QPushButton:disabled {
-                            background-color: #666666;
-                            border: 1px solid #555555;
-                        }
-                    """)
-                    delete_btn.clicked.connect(lambda _, r=row: self.handle_delete_unreferenced_graphic(r))
-                    self.table.setCellWidget(row, 2, delete_btn)
-                self.feedback_label.setText(f"Found {len(results)} unreferenced graphics files")
-                self.table.setVisible(True)
-                self.feedback_label.setVisible(True)
-                self.delete_all_btn.setEnabled(True)
-                self.logger.debug(f"Populated table with {len(results)} unreferenced graphics files")
-        except Exception as e:
-            self.feedback_label.setText(f"Error: {str(e)}")
-            self.table.setVisible(False)
-            self.feedback_label.setVisible(True)
-            self.delete_all_btn.setEnabled(False)
-            self.logger.error(f"Error checking unreferenced graphics: {str(e)}")
-        self.table.resizeColumnsToContents()
-        self.table.setColumnWidth(2, max(110, self.table.columnWidth(2)))
+        self.refresh_unreferenced_graphics()
+
+    def handle_unreferenced_delete_clicked(self, checked: bool = False):
+        # One slot for every row's Delete button; the row is resolved from the button's
+        # current position, so it stays correct after rows above it are removed
+        button = self.sender()
+        if not isinstance(button, QPushButton):
+            return
+        row = self.table.indexAt(button.pos()).row()
+        if self.current_mode == "unreferenced_graphics":
+            self.handle_delete_unreferenced_graphic(row)
+        else:
+            self.handle_delete_unreferenced(row)
 
     def handle_delete_unreferenced(self, row: int):
         if self.is_deleting:
@@ -979,6 +1012,7 @@ class FileSanityWidget(QWidget):
         full_path = os.path.join(self.directory_path, folder_path, file_name)
         try:
             move_xml_to_trash(full_path, self.directory_path)
+            self.invalidate_scan_cache()
             self.table.removeRow(row)
             remaining = self.table.rowCount()
             self.feedback_label.setText(f"Moved {file_name} to LegacyTextTuring. {remaining} files remaining.")
@@ -1038,6 +1072,7 @@ class FileSanityWidget(QWidget):
         full_path = os.path.join(self.directory_path, folder_path, file_name)
         try:
             move_graphic_to_trash(full_path, self.directory_path)
+            self.invalidate_scan_cache()
             self.table.removeRow(row)
             remaining = self.table.rowCount()
             self.feedback_label.setText(f"Moved {file_name} to LegacyTextTuring. {remaining} files remaining.")
@@ -1101,6 +1136,7 @@ class FileSanityWidget(QWidget):
                 errors.append(f"{file_name}: {str(e)}")
                 self.logger.error(f"Failed to move {full_path} to LegacyTextTuring: {str(e)}")
         self.table.setRowCount(0)
+        self.invalidate_scan_cache()
         if errors:
             self.feedback_label.setText(f"Moved {moved_count} files to LegacyTextTuring, {len(errors)} failed: {'; '.join(errors)}")
             self.table.setVisible(False)
@@ -1125,12 +1161,13 @@ class FileSanityWidget(QWidget):
             self.feedback_label.setVisible(True)
             self.logger.debug("No DITA MAP or directory selected")
             return
+        self.cancel_graphics_scan()
         self.current_mode = "unreferenced_xmls"
         self.delete_all_btn.setVisible(True)
         self.table.setHorizontalHeaderLabels(["File Name", "Folder Path", "Action"])
         self.table.setRowCount(0)
         try:
-            results = find_unreferenced_xmls(self.selected_ditamap, self.directory_path)
+            results = self.cached_unreferenced_xmls()
             if not results:
                 self.feedback_label.setText("No unreferenced XML files found")
                 self.table.setVisible(False)
@@ -1178,7 +1215,7 @@ class FileSanityWidget(QWidget):
                             border: 1px solid #555555;
                         }
                     """)
-                    delete_btn.clicked.connect(lambda _, r=row: self.handle_delete_unreferenced(r))
+                    delete_btn.clicked.connect(self.handle_unreferenced_delete_clicked)
                     self.table.setCellWidget(row, 2, delete_btn)
                 self.feedback_label.setText(f"Found {len(results)} unreferenced XML files")
                 self.table.setVisible(True)
@@ -1191,8 +1228,7 @@ class FileSanityWidget(QWidget):
             self.feedback_label.setVisible(True)
             self.delete_all_btn.setEnabled(False)
             self.logger.error(f"Error refreshing unreferenced XMLs: {str(e)}")
-        self.table.resizeColumnsToContents()
-        self.table.setColumnWidth(2, max(110, self.table.columnWidth(2)))
+        self.table.setColumnWidth(2, 110)
 
     def refresh_unreferenced_graphics(self):
         self.logger.debug("Refreshing unreferenced graphics")
@@ -1204,72 +1240,134 @@ class FileSanityWidget(QWidget):
             return
         self.current_mode = "unreferenced_graphics"
         self.delete_all_btn.setVisible(True)
+        self.delete_all_btn.setEnabled(False)
         self.table.setHorizontalHeaderLabels(["File Name", "Folder Path", "Action"])
         self.table.setRowCount(0)
-        try:
-            results = find_unreferenced_graphics(self.selected_ditamap, self.directory_path)
-            if not results:
-                self.feedback_label.setText("No unreferenced graphics files found")
-                self.table.setVisible(False)
-                self.feedback_label.setVisible(True)
-                self.delete_all_btn.setEnabled(False)
-                self.logger.debug("No unreferenced graphics files found")
-            else:
-                for row, (file_name, folder_path, status) in enumerate(results):
-                    self.table.insertRow(row)
-                    full_path = os.path.join(self.directory_path, folder_path, file_name)
-                    file_url = QUrl.fromLocalFile(full_path).toString()
-                    file_link_label = QLabel()
-                    file_link_label.setText(f'<a href="{file_url}" style="color: #0000FF; text-decoration: underline;">{file_name}</a>')
-                    file_link_label.setStyleSheet("background-color: #E6ECEF;")
-                    file_link_label.setOpenExternalLinks(True)
-                    file_link_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
-                    self.table.setCellWidget(row, 0, file_link_label)
-                    folder_full_path = os.path.join(self.directory_path, folder_path)
-                    folder_url = QUrl.fromLocalFile(folder_full_path).toString()
-                    folder_link_label = QLabel()
-                    folder_link_label.setText(f'<a href="{folder_url}" style="color: #0000FF; text-decoration: underline;">{folder_path}</a>')
-                    folder_link_label.setStyleSheet("background-color: #E6ECEF;")
-                    folder_link_label.setOpenExternalLinks(True)
-                    folder_link_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
-                    self.table.setCellWidget(row, 1, folder_link_label)
-                    delete_btn = QPushButton("Delete")
-                    delete_btn.setFont(QFont("Helvetica", 9))
-                    delete_btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #FF8C00;
-                            color: #FFFFFF;
-                            padding: 1px 2px;
-                            border-radius: 4px;
-                            border: 1px solid #CC7000;
-                            min-width: 48px;
-                            min-height: 18px;
-                            text-align: center;
-                        }
-                        QPushButton:hover {
-                            background-color: #FFA500;
-                            border: 1px solid #CC8400;
-                        }
-                        QPushButton:disabled {
-                            background-color: #666666;
-                            border: 1px solid #555555;
-                        }
-                    """)
-                    delete_btn.clicked.connect(lambda _, r=row: self.handle_delete_unreferenced_graphic(r))
-                    self.table.setCellWidget(row, 2, delete_btn)
-                self.feedback_label.setText(f"Found {len(results)} unreferenced graphics files")
-                self.table.setVisible(True)
-                self.feedback_label.setVisible(True)
-                self.delete_all_btn.setEnabled(True)
-                self.logger.debug(f"Populated table with {len(results)} unreferenced graphics files")
-        except Exception as e:
-            self.feedback_label.setText(f"Error: {str(e)}")
+        self.table.setColumnWidth(2, 110)
+        self.feedback_label.setText("Scanning for unreferenced graphics...")
+        self.feedback_label.setVisible(True)
+        self.cancel_graphics_scan()
+        self.graphics_scan_key = self.unreferenced_scan_key("unreferenced_graphics")
+        cached = self.scan_cache.get(self.graphics_scan_key) if self.graphics_scan_key else None
+        if cached is not None:
+            self.add_unreferenced_graphics_rows(cached)
+            self.show_unreferenced_graphics_result(cached)
+            return
+        # Parented to this widget so a superseded scan is not destroyed while still running
+        self.graphics_scan_generation = self.scan_cache_generation
+        self.graphics_scan_thread = UnreferencedGraphicsScanThread(self.selected_ditamap, self.directory_path, self)
+        self.graphics_scan_thread.watch.connect(self.watch_graphics_scan_inputs)
+        self.graphics_scan_thread.batch.connect(self.append_unreferenced_graphics)
+        self.graphics_scan_thread.result.connect(self.finish_unreferenced_graphics)
+        self.graphics_scan_thread.error.connect(self.fail_unreferenced_graphics)
+        self.graphics_scan_thread.finished.connect(self.graphics_scan_thread.deleteLater)
+        self.graphics_scan_thread.start()
+
+    def cancel_graphics_scan(self):
+        # A canceled scan keeps running until find_unreferenced_graphics returns, but emits nothing more
+        # and its late signals no longer match graphics_scan_thread
+        if self.graphics_scan_thread is not None:
+            self.graphics_scan_thread.cancel()
+            self.graphics_scan_thread = None
+
+    def stop_graphics_scans(self):
+        # Superseded scans are still children of this widget, so wait for all of them before it is destroyed
+        self.cancel_graphics_scan()
+        for thread in self.findChildren(UnreferencedGraphicsScanThread):
+            thread.cancel()
+            thread.wait()
+
+    def closeEvent(self, event):
+        self.stop_graphics_scans()
+        super().closeEvent(event)
+
+    def watch_graphics_scan_inputs(self, paths: list):
+        if self.sender() is not self.graphics_scan_thread:
+            return
+        self.watch_scan_inputs(paths)
+
+    def append_unreferenced_graphics(self, batch: list):
+        if self.sender() is not self.graphics_scan_thread or self.current_mode != "unreferenced_graphics":
+            return
+        self.add_unreferenced_graphics_rows(batch)
+
+    def add_unreferenced_graphics_rows(self, batch: list):
+        self.table.setVisible(True)
+        for file_name, folder_path, status in batch:
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            full_path = os.path.join(self.directory_path, folder_path, file_name)
+            file_url = QUrl.fromLocalFile(full_path).toString()
+            file_link_label = QLabel()
+            file_link_label.setText(f'<a href="{file_url}" style="color: #0000FF; text-decoration: underline;">{file_name}</a>')
+            file_link_label.setStyleSheet("background-color: #E6ECEF;")
+            file_link_label.setOpenExternalLinks(True)
+            file_link_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+            self.table.setCellWidget(row, 0, file_link_label)
+            folder_full_path = os.path.join(self.directory_path, folder_path)
+            folder_url = QUrl.fromLocalFile(folder_full_path).toString()
+            folder_link_label = QLabel()
+            folder_link_label.setText(f'<a href="{folder_url}" style="color: #0000FF; text-decoration: underline;">{folder_path}</a>')
+            folder_link_label.setStyleSheet("background-color: #E6ECEF;")
+            folder_link_label.setOpenExternalLinks(True)
+            folder_link_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+            self.table.setCellWidget(row, 1, folder_link_label)
+            delete_btn = QPushButton("Delete")
+            delete_btn.setFont(QFont("Helvetica", 9))
+            delete_btn.setStyleSheet("""
+                QPushButton {
+                    background-color: #FF8C00;
+                    color: #FFFFFF;
+                    padding: 1px 2px;
+                    border-radius: 4px;
+                    border: 1px solid #CC7000;
+                    min-width: 48px;
+                    min-height: 18px;
+                    text-align: center;
+                }
+                QPushButton:hover {
+                    background-color: #FFA500;
+                    border: 1px solid #CC8400;
+                }
+                QPushButton:disabled {
+                    background-color: #666666;
+                    border: 1px solid #555555;
+                }
+            """)
+            delete_btn.clicked.connect(self.handle_unreferenced_delete_clicked)
+            self.table.setCellWidget(row, 2, delete_btn)
+        self.feedback_label.setText(f"Scanning for unreferenced graphics... {self.table.rowCount()} found so far")
+
+    def finish_unreferenced_graphics(self, results: list):
+        if self.sender() is not self.graphics_scan_thread or self.current_mode != "unreferenced_graphics":
+            return
+        if self.graphics_scan_key and self.graphics_scan_generation == self.scan_cache_generation:
+            self.scan_cache[self.graphics_scan_key] = results
+        self.show_unreferenced_graphics_result(results)
+
+    def show_unreferenced_graphics_result(self, results: list):
+        total = len(results)
+        if not total:
+            self.feedback_label.setText("No unreferenced graphics files found")
             self.table.setVisible(False)
             self.feedback_label.setVisible(True)
             self.delete_all_btn.setEnabled(False)
-            self.logger.error(f"Error refreshing unreferenced graphics: {str(e)}")
-        self.table.resizeColumnsToContents()
-        self.table.setColumnWidth(2, max(110, self.table.columnWidth(2)))
+            self.logger.debug("No unreferenced graphics files found")
+            return
+        self.feedback_label.setText(f"Found {total} unreferenced graphics files")
+        self.table.setVisible(True)
+        self.feedback_label.setVisible(True)
+        self.delete_all_btn.setEnabled(True)
+        self.logger.debug(f"Populated table with {total} unreferenced graphics files")
+
+    def fail_unreferenced_graphics(self, message: str):
+        if self.sender() is not self.graphics_scan_thread or self.current_mode != "unreferenced_graphics":
+            return
+        self.feedback_label.setText(f"Error: {message}")
+        self.table.setVisible(False)
+        self.feedback_label.setVisible(True)
+        self.delete_all_btn.setEnabled(False)
+        self.logger.error(f"Error refreshing unreferenced graphics: {message}")
 
     def refresh_delete_directory(self, selected_dir: str):
         self.logger.debug(f"Refreshing delete unnecessary folders with selected_dir: {selected_dir}")
@@ -1331,5 +1429,4 @@ class FileSanityWidget(QWidget):
             self.delete_all_btn.setEnabled(False)
             self.feedback_label.setVisible(True)
             self.logger.error(f"Error refreshing delete unnecessary folders: {str(e)}")
-        self.table.resizeColumnsToContents()
-        self.table.setColumnWidth(2, max(110, self.table.columnWidth(2)))
\ No newline at end of file
+        self.table.setColumnWidth(2, 110)
\ No newline at end of file
@@ -1,33 +1,58 @@
 import os
+import sys
 from lxml import etree
 import re
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import cpu_count
 
-def _process_xml_file(args):
+# Parser tuned for validation: skip DTD loading, entity resolution and ID bookkeeping
+XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, load_dtd=False, collect_ids=False)
+# Compiled once so the expressions are not re-parsed for every file and image
+IMAGE_XPATH = etree.XPath("//image")
+# First <title> of the image's parent <fig>
+FIG_TITLE_XPATH = etree.XPath("parent::fig/title[1]")
+
+# Root directory for relative paths, set once per worker process by _init_worker
+_WORKER_ROOT = None
+
+def _init_worker(directory_path):
+    """
+    Store the scan root in the worker so each task only carries its file path.
+    """
+    global _WORKER_ROOT
+    _WORKER_ROOT = directory_path
+
+def _process_xml_file(file_path):
     """
     Process a single XML file for graphics validation.
     
     Args:
-        args: Tuple of (file_path, directory_path)
+        file_path: Path to the XML file, reported relative to the root set by _init_worker
         
     Returns:
-        list: List of tuples (relative_path, status, figure_title) for images with issues in this file.
+        tuple: (relative_path, issues) where issues is a list of (status, figure_title) tuples
+               for images with issues in this file. The path is sent once per file rather than
+               once per image to keep the result small when it is returned from a worker process.
     """
-    file_path, directory_path = args
-    results = []
+    relative_path = sys.intern(os.path.relpath(file_path, _WORKER_ROOT))
+    issues = []
     
     try:
         # Parse the XML file
-        tree = etree.parse(file_path)
+        tree = etree.parse(file_path, XML_PARSER)
         # Find all <image> elements
-        images = tree.xpath("//image")
+        images = IMAGE_XPATH(tree)
         for image in images:
             # Initialize status list for concatenation
             status_parts = []
 
+            # Read all attributes through a single attrib view
+            attrib = image.attrib
+            width = attrib.get("width")
+            scope = attrib.get("scope")
+            scale = attrib.get("scale")
+
             # Check width attribute
-            width = image.get("width")
             if not width:
                 status_parts.append("Width not set")
             else:
@@ -48,24 +73,17 @@ def _process_xml_file(args):
                         status_parts.append("Invalid width format")
 
             # Check scope attribute
-            scope = image.get("scope")
             if scope == "external":
                 status_parts.append("Invalid external scope")
 
             # Check scale attribute
-            scale = image.get("scale")
             if scale and scale.strip():
                 status_parts.append("Remove Image scale")
 
             # Check for parent <fig> and its <title>
-            parent_fig = image.xpath("parent::fig")
-            figure_title = "Missing Image Title"
-            has_valid_title = False
-            if parent_fig:
-                title = parent_fig[0].xpath("title")
-                if title and title[0].text and title[0].text.strip():
-                    figure_title = "---"
-                    has_valid_title = True
+            title = FIG_TITLE_XPATH(image)
+            has_valid_title = bool(title and title[0].text and title[0].text.strip())
+            figure_title = "---" if has_valid_title else "Missing Image Title"
 
             # Skip images with no issues
             if not status_parts and has_valid_title:
@@ -73,14 +91,11 @@ def _process_xml_file(args):
 
             # Combine status messages
             status = "; ".join(status_parts) if status_parts else "---"
-
-            # Compute relative path
-            relative_path = os.path.relpath(file_path, directory_path)
-            results.append((relative_path, status, figure_title))
-    except etree.LxmlError:
-        pass  # Skip malformed XML files
+            issues.append((status, figure_title))
+    except Exception:
+        return relative_path, []  # Skip malformed or unreadable XML files
     
-    return results
+    return relative_path, issues
 
 def validate_graphics(directory_path: str, use_multiprocessing: bool = True) -> list:
     """
@@ -106,7 +121,7 @@ def validate_graphics(directory_path: str, use_multiprocessing: bool = True) ->
         for file in files:
             if file.endswith(".xml"):
                 file_path = os.path.join(root, file)
-                xml_files.append((file_path, directory_path))
+                xml_files.append(file_path)
     
     if not xml_files:
         return []
@@ -116,18 +131,16 @@ def validate_graphics(directory_path: str, use_multiprocessing: bool = True) ->
     if use_multiprocessing and len(xml_files) > 1:
         # Use multiprocessing for better performance
         max_workers = min(cpu_count(), len(xml_files))
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(_process_xml_file, args): args for args in xml_files}
-            for future in as_completed(futures):
-                try:
-                    file_results = future.result()
-                    results.extend(file_results)
-                except Exception:
-                    pass  # Skip files that cause errors
+        # Hand each worker several files per round-trip instead of one
+        chunksize = max(1, len(xml_files) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(directory_path,)) as executor:
+            for relative_path, issues in executor.map(_process_xml_file, xml_files, chunksize=chunksize):
+                results.extend((relative_path, status, figure_title) for status, figure_title in issues)
     else:
         # Single-threaded processing
-        for args in xml_files:
-            file_results = _process_xml_file(args)
-            results.extend(file_results)
+        _init_worker(directory_path)
+        for file_path in xml_files:
+            relative_path, issues = _process_xml_file(file_path)
+            results.extend((relative_path, status, figure_title) for status, figure_title in issues)
 
     return results
\ No newline at end of file
@@ -1,28 +1,81 @@
 import os
 from lxml import etree
-import re
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import cpu_count
 
-def _process_xml_file_for_tables(args):
+def _iter_xml_files(path):
+    """
+    Recursively yield paths of .xml files under path using os.scandir.
+    DirEntry caches the file type from the directory listing, so no extra stat is needed per entry.
+    Unreadable directories are skipped, matching os.walk's default behavior.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_xml_files(entry.path)
+                elif entry.name.endswith(".xml") and entry.is_file():
+                    yield entry.path
+    except OSError:
+        return
+
+def _parse_colwidth(colwidth):
+    """
+    Parse an absolute colwidth such as "1.5in" or "100 pt" into (value, unit).
+    Like the prefix regex match this replaced, the value must start with a number, optional
+    whitespace and the unit, and anything after the unit is ignored, so "1inch" or "1.5 in;"
+    still count. Returns None when the value does not start that way.
+    Plain string checks are used instead of a regex because this runs once per <colspec>
+    across every table in the project.
+    """
+    length = len(colwidth)
+    end = 0
+    while end < length and colwidth[end].isdecimal():
+        end += 1
+    if end < length and colwidth[end] == ".":
+        fraction_end = end + 1
+        while fraction_end < length and colwidth[fraction_end].isdecimal():
+            fraction_end += 1
+        if fraction_end == end + 1:
+            return None  # "1." or ".": a digit or "." would be left before the unit
+        end = fraction_end
+    if end == 0:
+        return None
+    unit_start = end
+    while unit_start < length and colwidth[unit_start].isspace():
+        unit_start += 1
+    unit = colwidth[unit_start:unit_start + 2]
+    if unit != "in" and unit != "pt":
+        return None
+    return float(colwidth[:end]), unit
+
+# Root directory for relative paths, set once per worker process by _init_worker
+_WORKER_ROOT = None
+
+def _init_worker(directory_path):
+    """
+    Store the scan root in the worker so each task only carries its file path.
+    """
+    global _WORKER_ROOT
+    _WORKER_ROOT = directory_path
+
+def _process_xml_file_for_tables(file_path):
     """
     Process a single XML file for table validation.
     
     Args:
-        args: Tuple of (file_path, directory_path)
+        file_path: Path to the XML file, reported relative to the root set by _init_worker
         
     Returns:
         list: List of tuples (relative_path, table_title, width_issue) for tables with issues in this file.
     """
-    file_path, directory_path = args
+    relative_path = os.path.relpath(file_path, _WORKER_ROOT)
     results = []
     
     try:
-        # Parse the XML file
-        tree = etree.parse(file_path)
-        # Find all <table> elements
-        tables = tree.xpath("//table")
-        for table in tables:
+        # Stream the file, handling each <table> once it has been fully parsed.
+        # Entity resolution and ID bookkeeping are not needed for width/title checks.
+        for _, table in etree.iterparse(file_path, tag="table", resolve_entities=False, collect_ids=False):
             # Check for <title> tag
             title_elem = table.find("title")
             table_title = "---" if title_elem is not None and title_elem.text and title_elem.text.strip() else "Missing Table Title"
@@ -42,14 +95,14 @@ def _process_xml_file_for_tables(args):
                         if colwidth:
                             colwidth = colwidth.strip()
                             if colwidth == "1*":
+                                # Proportional widths clear any width issue, so the remaining colspecs don't matter
                                 has_proportional_width = True
                                 width_specified = True
-                                continue
+                                break
                             # Extract numeric value and unit (e.g., "1 in" -> 1.0, "in"; "100 pt" -> 100.0, "pt")
-                            match = re.match(r"(\d*\.?\d+)\s*(in|pt)", colwidth)
-                            if match:
-                                value = float(match.group(1))
-                                unit = match.group(2)
+                            parsed = _parse_colwidth(colwidth)
+                            if parsed:
+                                value, unit = parsed
                                 if unit == "in":
                                     total_width_in += value
                                 elif unit == "pt":
@@ -74,11 +127,16 @@ def _process_xml_file_for_tables(args):
 
             # Only include tables with at least one issue (missing title or width issue)
             if not has_title or width_issue in ["Table Width > 6.75inches", "Table Width > 486pt", "Width Not Specified"]:
-                # Compute the relative path from directory_path to file_path
-                relative_path = os.path.relpath(file_path, directory_path)
                 results.append((relative_path, table_title, width_issue))
-    except etree.LxmlError:
-        pass  # Skip malformed XML files
+
+            # Free the processed table and everything parsed before it
+            table.clear()
+            parent = table.getparent()
+            if parent is not None:
+                while table.getprevious() is not None:
+                    del parent[0]
+    except Exception:
+        return []  # Skip malformed or unreadable XML files
     
     return results
 
@@ -100,12 +158,7 @@ def validate_tables(directory_path: str, use_multiprocessing: bool = True) -> li
               or if colwidth="1*".
     """
     # Collect all XML files recursively
-    xml_files = []
-    for root, _, files in os.walk(directory_path):
-        for file in files:
-            if file.endswith(".xml"):
-                file_path = os.path.join(root, file)
-                xml_files.append((file_path, directory_path))
+    xml_files = list(_iter_xml_files(directory_path))
     
     if not xml_files:
         return []
@@ -115,18 +168,16 @@ def validate_tables(directory_path: str, use_multiprocessing: bool = True) -> li
     if use_multiprocessing and len(xml_files) > 1:
         # Use multiprocessing for better performance
         max_workers = min(cpu_count(), len(xml_files))
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(_process_xml_file_for_tables, args): args for args in xml_files}
-            for future in as_completed(futures):
-                try:
-                    file_results = future.result()
-                    results.extend(file_results)
-                except Exception:
-                    pass  # Skip files that cause errors
+        # Hand each worker several files per round-trip instead of one
+        chunksize = max(1, len(xml_files) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(directory_path,)) as executor:
+            for file_results in executor.map(_process_xml_file_for_tables, xml_files, chunksize=chunksize):
+                results.extend(file_results)
     else:
         # Single-threaded processing
-        for args in xml_files:
-            file_results = _process_xml_file_for_tables(args)
+        _init_worker(directory_path)
+        for file_path in xml_files:
+            file_results = _process_xml_file_for_tables(file_path)
             results.extend(file_results)
 
     return results
\ No newline at end of file
@@ -1,31 +1,188 @@
 import os
+import struct
+import zlib
 from PIL import Image, UnidentifiedImageError
 import logging
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from multiprocessing import cpu_count
 
 logger = logging.getLogger(__name__)
 
-def _process_image_file(args):
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+IMAGE_EXTENSIONS = frozenset((".jpg", ".jpeg", ".png"))
+
+def _read_png_header(f):
+    """
+    Read width, height and DPI from the IHDR and pHYs chunks of a PNG file.
+    f must be positioned just after the signature. Chunks are read up to the first IDAT,
+    which is where Pillow stops when opening the file, and DPI follows Pillow's conversion
+    of pixels-per-meter so results match Image.open(...).info['dpi'].
+
+    Returns:
+        tuple: (width, height, dpi), or None if the header is malformed.
+    """
+    width = height = None
+    dpi = (0, 0)
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            break
+        length, chunk_type = struct.unpack(">I4s", chunk_header)
+        if chunk_type in (b"IDAT", b"IEND"):
+            break
+        if chunk_type in (b"IHDR", b"pHYs"):
+            data = f.read(length)
+            crc = f.read(4)
+            if len(data) < length or len(crc) < 4 or zlib.crc32(chunk_type + data) != struct.unpack(">I", crc)[0]:
+                return None
+            if chunk_type == b"IHDR" and length >= 8:
+                width, height = struct.unpack(">II", data[:8])
+            elif chunk_type == b"pHYs" and length >= 9 and data[8] == 1:  # Unit is meter
+                px, py = struct.unpack(">II", data[:8])
+                dpi = (px * 0.0254, py * 0.0254)
+        else:
+            f.seek(length + 4, os.SEEK_CUR)  # Skip chunk data and CRC
+    if width is None:
+        return None
+    return width, height, dpi
+
+def _read_jpeg_header(f):
+    """
+    Read width, height and DPI from the marker segments of a JPEG file.
+    f must be positioned just after the SOI marker. Segments are read up to the first SOS,
+    which is where Pillow stops when opening the file; only SOFn and APP0 JFIF payloads are
+    read, everything else is skipped with a seek.
+
+    Returns:
+        tuple: (width, height, dpi), or None if the header is malformed or the DPI would have
+        to come from EXIF, which is left to Pillow so results match Image.open(...).info['dpi'].
+    """
+    width = height = None
+    dpi = None
+    has_exif = False
+    while True:
+        byte = f.read(1)
+        if not byte:
+            break
+        if byte != b"\xff":
+            continue
+        marker = f.read(1)
+        while marker == b"\xff":  # Fill bytes
+            marker = f.read(1)
+        if not marker:
+            break
+        marker = marker[0]
+        if marker in (0xD9, 0xDA):  # EOI, SOS
+            break
+        if marker == 0x01 or marker == 0xD8 or 0xD0 <= marker <= 0xD7:  # Markers without a length
+            continue
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0] - 2
+        if length < 0:
+            return None
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):  # SOFn
+            data = f.read(length)
+            if len(data) < 5:
+                return None
+            height, width = struct.unpack(">HH", data[1:5])
+        elif marker == 0xE0:  # APP0
+            data = f.read(length)
+            if data[:4] == b"JFIF" and len(data) >= 12 and data[7] == 1:  # Unit is inch
+                dpi = struct.unpack(">HH", data[8:12])
+        elif marker == 0xE1:  # APP1
+            data = f.read(min(length, 6))
+            if data == b"Exif\x00\x00":
+                has_exif = True
+            f.seek(length - len(data), os.SEEK_CUR)
+        else:
+            f.seek(length, os.SEEK_CUR)
+    if width is None or (dpi is None and has_exif):
+        return None
+    return width, height, dpi or (0, 0)
+
+def _read_image_header(file_path, file_size=None):
+    """
+    Get (width, height, dpi, file_size) for an image, reading only the PNG or JPEG header when possible.
+    The file is opened once: unless file_size is given, its size comes from fstat on the open handle, and the Pillow
+    fallback for other formats, malformed headers or EXIF-only JPEG DPI reads from the same handle.
+    Pillow's UnidentifiedImageError and PermissionError still propagate to the caller.
+    """
+    with open(file_path, "rb") as f:
+        if file_size is None:
+            file_size = os.fstat(f.fileno()).st_size
+        signature = f.read(8)
+        header = None
+        if signature == PNG_SIGNATURE:
+            header = _read_png_header(f)
+        elif signature[:3] == b"\xff\xd8\xff":
+            f.seek(2)
+            header = _read_jpeg_header(f)
+        if header:
+            return header + (file_size,)
+        f.seek(0)
+        with Image.open(f) as img:
+            width, height = img.size
+            return width, height, img.info.get('dpi', (0, 0)), file_size
+
+def _iter_images(path, relative_path, skip_folders, skip_files=False):
+    """
+    Recursively yield (file_path, relative_path, entry) for JPEG and PNG files under path using os.scandir.
+    Files of each directory are yielded in name order before its subdirectories, matching the
+    previous os.walk traversal. The DirEntry is passed on so the file size comes from its stat
+    cache, which is free on Windows. Subfolders named in skip_folders are never entered; skip_files
+    leaves out the files directly under path, for when the selected folder itself is one of them.
+    Unreadable directories are skipped.
+    """
+    images = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        if entry.name.lower() in skip_folders:
+                            logger.debug(f"Skipping folder: {entry.path}")
+                        else:
+                            subdirs.append(entry)
+                elif not skip_files:
+                    name = entry.name
+                    ext = name[name.rfind("."):].lower()
+                    if ext in IMAGE_EXTENSIONS:
+                        images.append(entry)
+    except OSError as e:
+        logger.error(f"Error accessing directory {path}: {str(e)}")
+        return
+    images.sort(key=lambda entry: entry.name)  # Sort files alphabetically
+    for entry in images:
+        yield entry.path, relative_path, entry
+    for entry in subdirs:
+        yield from _iter_images(entry.path, relative_path + entry.name + "/", skip_folders)
+
+def _process_image_file(args, quick_mode=False):
     """
     Process a single image file for validation.
     
     Args:
-        args: Tuple of (file_path, relative_path)
+        args: Tuple of (file_path, relative_path, entry) where entry is the file's os.DirEntry
+        quick_mode: If True, a file over 1MB is reported as "File size > 1MB" without reading its header.
         
     Returns:
         tuple: (relative_path, reason) if image needs action, None otherwise.
     """
-    file_path, relative_path = args
-    file = os.path.basename(file_path)
+    file_path, relative_path, entry = args
+    file = entry.name
     
     try:
-        # Check image dimensions and file size
-        with Image.open(file_path) as img:
-            width, height = img.size
-            dpi = img.info.get('dpi', (0, 0))
-        file_size_bytes = os.path.getsize(file_path)
+        file_size_bytes = entry.stat().st_size
         file_size_mb = file_size_bytes / (1024 * 1024)
+        if quick_mode and file_size_mb > 1:
+            return (file_path, relative_path, "File size > 1MB")
+
+        # Check image dimensions
+        width, height, dpi, file_size_bytes = _read_image_header(file_path, file_size_bytes)
 
         # Collect reasons for needing resizing
         reasons = []
@@ -38,6 +195,10 @@ def _process_image_file(args):
         if not file.lower().endswith(".png"):
             reasons.append("Not PNG")
         if dpi != (144, 144):
+            # pHYs stores pixels per meter, so 144 DPI reads back as e.g. 143.9999;
+            # images only off by that rounding are not reported at all
+            if round(dpi[0]) == 144 and round(dpi[1]) == 144:
+                return None
             reasons.append("DPI !=144")
 
         # If there are reasons, return the issue
@@ -53,7 +214,8 @@ def _process_image_file(args):
     
     return None
 
-def scan_images_for_resizing(directory_path: str, use_multiprocessing: bool = True) -> tuple:
+def scan_images_for_resizing(directory_path: str, use_multiprocessing: bool = True, is_network: bool = False,
+                             quick_mode: bool = False) -> tuple:
     """
     Scan the directory and subfolders for JPEG and PNG images, identifying those needing
     resizing based on width > 972px, height > 972px, or size > 1MB, not PNG, DPI !=144, skipping LegacyTextTuring, out, and temp folders.
@@ -61,6 +223,9 @@ def scan_images_for_resizing(directory_path: str, use_multiprocessing: bool = Tr
     Args:
         directory_path: Path to the directory to scan.
         use_multiprocessing: Whether to use parallel processing (default: True).
+        is_network: Whether the directory is on a network drive, allowing more concurrent reads (default: False).
+        quick_mode: Whether to report files over 1MB by size alone, without reading their headers; their
+            reason is then only "File size > 1MB" (default: False).
 
     Returns:
         tuple: (image_list, total_images_scanned, images_to_be_resized)
@@ -68,54 +233,31 @@ def scan_images_for_resizing(directory_path: str, use_multiprocessing: bool = Tr
             - total_images_scanned: Total number of JPEG and PNG images scanned.
             - images_to_be_resized: Number of images needing resizing.
     """
-    image_list = []
     skip_folders = {"legacytextturing", "out", "temp"}  # Case-insensitive set
 
-    # Collect all image files recursively
-    image_files = []
-    for root, dirs, files in os.walk(directory_path, topdown=True):
-        # Skip specified folders
-        if os.path.basename(root).lower() in skip_folders:
-            logger.debug(f"Skipping folder: {root}")
-            continue
-        try:
-            for file in sorted(files):  # Sort files alphabetically
-                if file.lower().endswith((".jpg", ".jpeg", ".png")):
-                    file_path = os.path.join(root, file)
-                    # Get relative path
-                    relative_path = os.path.relpath(root, directory_path).replace(os.sep, "/")
-                    if relative_path == ".":
-                        relative_path = ""
-                    else:
-                        relative_path += "/"
-                    image_files.append((file_path, relative_path))
-        except PermissionError as e:
-            logger.error(f"Error accessing directory {root}: {str(e)}")
-            continue  # Skip inaccessible subfolders
+    # Collect all image files recursively, pruning skipped folders
+    skip_root = os.path.basename(directory_path).lower() in skip_folders
+    if skip_root:
+        logger.debug(f"Skipping folder: {directory_path}")
+    image_files = list(_iter_images(directory_path, "", skip_folders, skip_root))
 
     total_images_scanned = len(image_files)
     
     if not image_files:
         return [], 0, 0
     
+    process = partial(_process_image_file, quick_mode=quick_mode)
     if use_multiprocessing and len(image_files) > 1:
-        # Use multiprocessing for better performance
-        max_workers = min(cpu_count(), len(image_files))
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(_process_image_file, args): args for args in image_files}
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    if result:
-                        image_list.append(result)
-                except Exception:
-                    pass  # Skip files that cause errors
+        # Header reads are I/O-bound and release the GIL, as does Pillow's fallback decoding,
+        # so threads avoid process startup and pickling; network drives get more reads in flight
+        if is_network:
+            max_workers = min(64, max(8, len(image_files)))
+        else:
+            max_workers = min(cpu_count() * 4, len(image_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            image_list = [result for result in executor.map(process, image_files) if result is not None]
     else:
         # Single-threaded processing
-        for args in image_files:
-            result = _process_image_file(args)
-            if result:
-                image_list.append(result)
+        image_list = [result for result in map(process, image_files) if result is not None]
 
-    images_to_be_resized = len(image_list)
-    return image_list, total_images_scanned, images_to_be_resized
\ No newline at end of file
+    return image_list, total_images_scanned, len(image_list)
\ No newline at end of file
@@ -1,60 +1,82 @@
 import sys
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget, QFileDialog, QGridLayout, QSizePolicy
-from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtCore import Qt, QRect, QSize
 from PyQt6.QtGui import QFont, QPixmap, QColor, QPainter, QPalette
 from check_image_sanity import CheckImageSanityWidget
 from file_sanity import FileSanityWidget
 from validate_output import ValidateOutputWidget
 from validate_xmls import ValidateXMLsWidget
 import os
-import shutil
 import time
-import tempfile
+import zipfile
 from markdown_viewer import MarkdownViewer  # Import Markdown viewer
 
+DOCS_DIR = os.path.join(os.path.dirname(__file__), "docs")
+# Already-compressed formats are stored as-is in backups; deflating them again costs time for no gain
+STORED_EXTENSIONS = frozenset((".png", ".jpg", ".jpeg", ".gif", ".zip"))
+
+# Window-wide stylesheet, parsed once and inherited by every child widget
+WINDOW_QSS = """
+    QMainWindow, QWidget {
+        background-color: #1F252A;
+    }
+    QPushButton[menu="true"] {
+        background-color: #0D6E6E;
+        color: #FFFFFF;
+        padding: 10px 20px;
+        border-radius: 4px;
+        border: 1px solid #0A5555;
+    }
+    QPushButton[menu="true"]:hover {
+        background-color: #139999;
+        border: 1px solid #0C7A7A;
+    }
+"""
+
+
+def help_path(button_name):
+    """Return (md_path, exists) for the help page of a button."""
+    md_path = os.path.join(DOCS_DIR, button_name.lower().replace(" ", "_") + ".md")
+    return md_path, os.path.exists(md_path)
+
 
 class CustomToggle(QPushButton):
+    # Knob colour and positions, built once instead of on every paint
+    KNOB_COLOR = QColor(255, 255, 255)
+    KNOB_ON = QRect(20, 1, 18, 18)
+    KNOB_OFF = QRect(1, 1, 18, 18)
+    # Covers both states through the :checked pseudo-state, so it is set once
+    STYLESHEET = """
+        QPushButton {
+            background-color: #d3d3d3;
+            border-radius: 10px;
+            padding: 1px;
+        }
+        QPushButton:checked {
+            background-color: #0D6E6E;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setCheckable(True)
         self.setFixedSize(40, 20)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #d3d3d3;
-                border-radius: 10px;
-                padding: 1px;
-            }
-            QPushButton:checked {
-                background-color: #0D6E6E;
-            }
-        """)
+        self.setStyleSheet(self.STYLESHEET)
         self.setChecked(False)
         self.update_toggle()
 
 
     def update_toggle(self):
-        if self.isChecked():
-            self.setStyleSheet(self.styleSheet() + """
-                QPushButton:checked {
-                    background-color: #0D6E6E;
-                }
-            """)
-        else:
-            self.setStyleSheet(self.styleSheet() + """
-                QPushButton {
-                    background-color: #d3d3d3;
-                }
-            """)
+        # The background follows :checked in STYLESHEET; only the knob needs a repaint
+        self.update()
 
 
     def paintEvent(self, event):
         super().paintEvent(event)
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        diameter = 18
-        x_pos = 20 if self.isChecked() else 1
-        painter.setBrush(QColor("#ffffff"))
-        painter.drawEllipse(x_pos, 1, diameter, diameter)
+        painter.setBrush(self.KNOB_COLOR)
+        painter.drawEllipse(self.KNOB_ON if self.isChecked() else self.KNOB_OFF)
 
 
     def mousePressEvent(self, event):
@@ -72,7 +94,7 @@ class TextTuringApp(QMainWindow):
         self.setWindowTitle("TextTuring")
         self.setGeometry(100, 100, 800, 600)
         self.help_enabled = False
-        self.markdown_viewers = []  # Track open Markdown viewers
+        self.markdown_viewers = {}  # Markdown viewers by button name, reused across clicks
         self.button_info_labels = {}  # Map button names to info labels
 
 
@@ -81,7 +103,7 @@ class TextTuringApp(QMainWindow):
         palette.setColor(QPalette.ColorRole.Window, QColor("#1F252A"))
         palette.setColor(QPalette.ColorRole.Base, QColor("#1F252A"))
         self.setPalette(palette)
-        self.setStyleSheet("QMainWindow, QWidget { background-color: #1F252A; }")
+        self.setStyleSheet(WINDOW_QSS)
 
 
         # Main widget
@@ -142,8 +164,10 @@ class TextTuringApp(QMainWindow):
         image_path = os.path.join(os.path.dirname(__file__), "logo.png")
         if os.path.exists(image_path):
             pixmap = QPixmap(image_path)
-            scaled_pixmap = pixmap.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.image_label.setPixmap(scaled_pixmap)
+            # logo.png is shipped at 300x300, so only rescale if it is replaced with another size
+            if pixmap.size() != QSize(300, 300):
+                pixmap = pixmap.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            self.image_label.setPixmap(pixmap)
         else:
             print(f"Warning: Image file not found at {image_path}")
         main_menu_layout.addWidget(self.image_label, stretch=1)
@@ -161,19 +185,7 @@ class TextTuringApp(QMainWindow):
         for name in button_names:
             btn = QPushButton(name)
             btn.setFont(QFont("Helvetica", 12, QFont.Weight.Medium))
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #0D6E6E;
-                    color: #FFFFFF;
-                    padding: 10px 20px;
-                    border-radius: 4px;
-                    border: 1px solid #0A5555;
-                }
-                QPushButton:hover {
-                    background-color: #139999;
-                    border: 1px solid #0C7A7A;
-                }
-            """)
+            btn.setProperty("menu", True)  # Styled by the QPushButton[menu="true"] rules in WINDOW_QSS
             button_layout.addWidget(btn)
             self.buttons.append(btn)
 
@@ -182,18 +194,24 @@ class TextTuringApp(QMainWindow):
         self.stacked_widget.addWidget(main_menu_widget)
 
 
-        # Add view widgets
-        self.file_sanity_widget = FileSanityWidget(self)
-        self.validate_xmls_widget = ValidateXMLsWidget(self)
-        self.check_image_sanity_widget = CheckImageSanityWidget(self)
-        self.validate_output_widget = ValidateOutputWidget(self)
+        # Add view widgets; the tool views are built on first use, with placeholders holding their slots
         self.backup_widget = QWidget()
         self.setup_backup_widget()
+        # Resolve help pages once; the docs folder ships with the app and does not change at runtime
+        self.help_paths = {name: help_path(name) for name in self.button_info_labels}
         self.stacked_widget.addWidget(self.backup_widget)
-        self.stacked_widget.addWidget(self.file_sanity_widget)
-        self.stacked_widget.addWidget(self.validate_xmls_widget)
-        self.stacked_widget.addWidget(self.check_image_sanity_widget)
-        self.stacked_widget.addWidget(self.validate_output_widget)
+        self.file_sanity_widget = None
+        self.validate_xmls_widget = None
+        self.check_image_sanity_widget = None
+        self.validate_output_widget = None
+        self.view_factories = {
+            2: ("file_sanity_widget", FileSanityWidget),
+            3: ("validate_xmls_widget", ValidateXMLsWidget),
+            4: ("check_image_sanity_widget", CheckImageSanityWidget),
+            5: ("validate_output_widget", ValidateOutputWidget),
+        }
+        for _ in self.view_factories:
+            self.stacked_widget.addWidget(QWidget())
 
 
         # Connect buttons
@@ -206,15 +224,24 @@ class TextTuringApp(QMainWindow):
 
 
     def open_markdown_help(self, button_name):
-        """Open the corresponding .md file for the button."""
-        md_name = button_name.lower().replace(" ", "_") + ".md"
-        md_path = os.path.join(os.path.dirname(__file__), "docs", md_name)
-        if not os.path.exists(md_path):
-            print(f"Warning: Markdown file not found at {md_path}")
-            return
-        viewer = MarkdownViewer(md_path, button_name, self)  # Pass self as main_window
-        self.markdown_viewers.append(viewer)
+        """Open the corresponding .md file for the button, reusing its viewer if it was opened before."""
+        viewer = self.markdown_viewers.get(button_name)
+        if viewer is None:
+            md_path, md_exists = self.help_paths.get(button_name) or help_path(button_name)
+            if not md_exists:
+                print(f"Warning: Markdown file not found at {md_path}")
+                return
+            viewer = MarkdownViewer(md_path, button_name, self)  # Pass self as main_window
+            self.markdown_viewers[button_name] = viewer
+        else:
+            # Keep a single help window open, as MarkdownViewer does when it is created
+            current = getattr(self, 'markdown_viewer', None)
+            if current is not None and current is not viewer:
+                current.close()
+            self.markdown_viewer = viewer
         viewer.show()
+        viewer.raise_()
+        viewer.activateWindow()
 
 
     def setup_backup_widget(self):
@@ -326,31 +353,39 @@ class TextTuringApp(QMainWindow):
             zip_path = os.path.join(legacy_dir, zip_name)
 
 
-            # Create a temporary directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Copy directory contents to temp_dir, excluding LegacyTextTuring
-                for item in os.listdir(directory_path):
-                    if item == "LegacyTextTuring":
-                        continue
-                    src = os.path.join(directory_path, item)
-                    dst = os.path.join(temp_dir, item)
-                    if os.path.isdir(src):
-                        shutil.copytree(src, dst)
-                    else:
-                        shutil.copy2(src, dst)
-                # Create ZIP from temp_dir
-                shutil.make_archive(
-                    zip_path.replace(".zip", ""),
-                    "zip",
-                    temp_dir
-                )
+            # Stream files straight into the archive, excluding LegacyTextTuring at the top level
+            # Level 3 compresses text-heavy XML nearly as well as the default level 6, in much less time
+            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=3) as zf:
+                for root, dirs, files in os.walk(directory_path):
+                    if root == directory_path:
+                        dirs[:] = [d for d in dirs if d != "LegacyTextTuring"]
+                    for name in dirs:
+                        path = os.path.join(root, name)
+                        zf.write(path, os.path.relpath(path, directory_path))
+                    for name in files:
+                        path = os.path.join(root, name)
+                        compress_type = zipfile.ZIP_STORED if os.path.splitext(name)[1].lower() in STORED_EXTENSIONS else None
+                        zf.write(path, os.path.relpath(path, directory_path), compress_type=compress_type)
             self.backup_feedback_label.setText(f"Backup created and stored in LegacyTextTuring/{zip_name}")
         except Exception as e:
             self.backup_feedback_label.setText(f"Error creating backup: {str(e)}")
 
 
+    def build_view(self, index):
+        """Construct the view widget for index and swap it in for its placeholder."""
+        name, widget_class = self.view_factories.pop(index)
+        widget = widget_class(self)
+        placeholder = self.stacked_widget.widget(index)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stacked_widget.insertWidget(index, widget)
+        setattr(self, name, widget)
+
+
     def switch_view(self, index):
         """Switch to the specified view in the stacked widget, preserving toggle state."""
+        if index in self.view_factories:
+            self.build_view(index)
         self.stacked_widget.setCurrentIndex(index)
         if hasattr(self, 'toggle_switch') and hasattr(self, 'help_enabled'):
             self.toggle_switch.setChecked(self.help_enabled)
@@ -389,7 +424,7 @@ class TextTuringApp(QMainWindow):
 
     def closeEvent(self, event):
         """Close all MarkdownViewer instances when the main window closes."""
-        for viewer in self.markdown_viewers:
+        for viewer in self.markdown_viewers.values():
             viewer.close()
         event.accept()
 
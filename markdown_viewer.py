@@ -1,14 +1,81 @@
 from PyQt6.QtWidgets import QMainWindow, QTextEdit, QVBoxLayout, QWidget
 from PyQt6.QtGui import QFont
-from PyQt6.QtCore import Qt, QRect, Qt as QtEnum, QUrl
+from PyQt6.QtCore import Qt, QRect, Qt as QtEnum, QUrl, QObject, QRunnable, QThreadPool, pyqtSignal
 import markdown
+from markdown.extensions import Extension
+from markdown.treeprocessors import Treeprocessor
 import os
 import logging
-import re
 from urllib.parse import quote
+from functools import lru_cache
+import threading
 
-# Setup basic logging for debugging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class ImageSrcRewriter(Treeprocessor):
+    """Point <img> elements at encoded file:// URLs under base_dir and set their display size."""
+    base_dir = ""
+
+    def run(self, root):
+        urls = {}  # Pages often repeat the same image, so each src is joined and quoted once
+        for img in root.iter('img'):
+            src = img.get('src', '')
+            url = urls.get(src)
+            if url is None:
+                url = urls[src] = "file:///" + quote(os.path.join(self.base_dir, src).replace(os.sep, "/"))
+            img.set('src', url)
+            img.set('width', "384")
+            img.set('height', "384")
+            img.set('alt', src)
+
+class ImageSrcExtension(Extension):
+    def extendMarkdown(self, md):
+        # Runs after the inline processor has created the <img> elements
+        md.treeprocessors.register(ImageSrcRewriter(md), 'rewrite_img', 15)
+
+# Built once and reused for every help page
+MARKDOWN = markdown.Markdown(extensions=['extra', ImageSrcExtension()])
+HTML_TEMPLATE = "<html><body>%s</body></html>"
+# MARKDOWN and its image rewriter hold per-conversion state, so pool threads convert one page at a time
+RENDER_LOCK = threading.Lock()
+
+@lru_cache(maxsize=32)
+def render_markdown_html(md_path, mtime_ns):
+    """
+    Render a Markdown file to the HTML shown in the viewer.
+    Cached by (md_path, mtime_ns): reopening an unchanged help page skips reading and converting it.
+    """
+    with open(md_path, 'r', encoding='utf-8') as f:
+        md_content = f.read()
+    base_dir = os.path.dirname(os.path.abspath(md_path))
+
+    # Convert Markdown to HTML, rewriting relative image paths to encoded file:// URLs on the way
+    with RENDER_LOCK:
+        MARKDOWN.treeprocessors['rewrite_img'].base_dir = base_dir
+        html_content = MARKDOWN.reset().convert(md_content)
+
+    # Wrap HTML content for proper rendering
+    return HTML_TEMPLATE % html_content
+
+class RenderSignals(QObject):
+    ready = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+class RenderTask(QRunnable):
+    """Render a Markdown file on a QThreadPool thread, reporting the HTML or the error through signals."""
+    def __init__(self, md_path, mtime_ns):
+        super().__init__()
+        self.md_path = md_path
+        self.mtime_ns = mtime_ns
+        self.signals = RenderSignals()  # Created on the GUI thread, so connected slots run there
+
+    def run(self):
+        try:
+            html_with_base = render_markdown_html(self.md_path, self.mtime_ns)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.ready.emit(html_with_base)
 
 class MarkdownViewer(QMainWindow):
     def __init__(self, md_path, title, main_window):
@@ -63,46 +130,41 @@ class MarkdownViewer(QMainWindow):
         self.load_markdown(md_path)
 
     def load_markdown(self, md_path):
-        """Load and render the Markdown file as HTML."""
+        """Load the Markdown file and render it as HTML on a pool thread, showing a placeholder meanwhile."""
         try:
-            with open(md_path, 'r', encoding='utf-8') as f:
-                md_content = f.read()
             # Get the directory of the Markdown file
             base_dir = os.path.dirname(os.path.abspath(md_path))
-            logging.debug(f"Markdown file directory: {base_dir}")
+            logger.debug(f"Markdown file directory: {base_dir}")
             
             # Verify image existence
             image_path = os.path.join(base_dir, "image.png")
-            logging.debug(f"Looking for image at: {image_path}")
-            if not os.path.exists(image_path):
-                logging.error(f"Image file not found: {image_path}")
+            logger.debug(f"Looking for image at: {image_path}")
+            if not os.path.isfile(image_path):
+                logger.error(f"Image file not found: {image_path}")
                 self.text_edit.setText(f"Error: Image file not found at {image_path}")
                 return
 
-            # Convert Markdown to HTML
-            
-            html_content = markdown.markdown(md_content, extensions=['extra'])
-       
-            # Replace relative image paths with encoded file:// URLs and set size
-            html_content = re.sub(
-                r'<img[^>]+src=["\']([^"\']+)["\']',
-                lambda m: f'<img src="file:///{quote(os.path.join(base_dir, m.group(1)).replace(os.sep, "/"))}" width="384" height="384" alt="{m.group(1)}"',
-                html_content
-            )
-            # Wrap HTML content for proper rendering
-            html_with_base = f"""
-            <html>
-            <body>
-                {html_content}
-            </body>
-            </html>
-            """
-            logging.debug(f"Generated HTML: {html_with_base}")
-            self.text_edit.setHtml(html_with_base)
-            logging.debug("HTML content set successfully")
+            # The modification time keys the render cache, so an edited file is rendered again
+            mtime_ns = os.stat(md_path).st_mtime_ns
+            self.text_edit.setText("Loading...")
+            task = RenderTask(md_path, mtime_ns)
+            task.signals.ready.connect(self.show_html)
+            task.signals.failed.connect(self.show_error)
+            self.render_signals = task.signals  # Keep the signals alive until the task reports back
+            QThreadPool.globalInstance().start(task)
         except Exception as e:
-            logging.error(f"Error loading Markdown: {str(e)}")
-            self.text_edit.setText(f"Error loading help file: {str(e)}")
+            self.show_error(str(e))
+
+    def show_html(self, html_with_base):
+        """Display HTML rendered by a RenderTask."""
+        logger.debug(f"Generated HTML: {html_with_base}")
+        self.text_edit.setHtml(html_with_base)
+        logger.debug("HTML content set successfully")
+
+    def show_error(self, message):
+        """Display an error from loading or rendering the Markdown file."""
+        logger.error(f"Error loading Markdown: {message}")
+        self.text_edit.setText(f"Error loading help file: {message}")
 
     def closeEvent(self, event):
         """Ensure proper cleanup when closing."""
@@ -1,45 +1,166 @@
 """
 Utility functions for detecting network drives and optimizing performance.
 """
+import ctypes
+import ctypes.util
 import os
 import platform
-import subprocess
 import tempfile
 import time
 
 
-def is_network_drive(path: str) -> bool:
+def _mount_root(abs_path: str) -> str:
+    """
+    Return the root of the volume containing abs_path: the drive or UNC share on Windows,
+    the nearest mount point elsewhere.
+    """
+    if platform.system() == "Windows":
+        drive, _ = os.path.splitdrive(abs_path)
+        return drive or abs_path
+    path = abs_path
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+# Common network drive indicators in folder names
+NETWORK_INDICATORS = ('google drive', 'googledrive', 'onedrive', 'dropbox', 'icloud', 'box sync', 'sharepoint')
+# Filesystem types used by network shares and remote mounts
+NETWORK_FS_TYPES = frozenset(("nfs", "nfs4", "cifs", "smb", "smbfs", "smb3", "afpfs", "webdav", "davfs", "sshfs"))
+MNT_LOCAL = 0x00001000  # macOS statfs flag for filesystems stored locally
+DRIVE_REMOTE = 4  # Windows GetDriveTypeW result for network drives
+
+
+class _DarwinStatfs(ctypes.Structure):
+    """struct statfs as returned by the 64-bit inode statfs on macOS."""
+    _fields_ = [
+        ("f_bsize", ctypes.c_uint32),
+        ("f_iosize", ctypes.c_int32),
+        ("f_blocks", ctypes.c_uint64),
+        ("f_bfree", ctypes.c_uint64),
+        ("f_bavail", ctypes.c_uint64),
+        ("f_files", ctypes.c_uint64),
+        ("f_ffree", ctypes.c_uint64),
+        ("f_fsid", ctypes.c_int32 * 2),
+        ("f_owner", ctypes.c_uint32),
+        ("f_type", ctypes.c_uint32),
+        ("f_flags", ctypes.c_uint32),
+        ("f_fssubtype", ctypes.c_uint32),
+        ("f_fstypename", ctypes.c_char * 16),
+        ("f_mntonname", ctypes.c_char * 1024),
+        ("f_mntfromname", ctypes.c_char * 1024),
+        ("f_flags_ext", ctypes.c_uint32),
+        ("f_reserved", ctypes.c_uint32 * 7),
+    ]
+
+
+# Parsed /proc/self/mountinfo and when it was read; refreshed after MOUNT_TABLE_TTL seconds
+MOUNT_TABLE_TTL = 30.0
+_MOUNT_TABLE = None
+_MOUNT_TABLE_TIME = 0.0
+
+
+def _linux_mounts() -> dict:
+    """
+    Map mount points to filesystem types from /proc/self/mountinfo.
+    When mounts are stacked on the same point, the last (visible) one wins.
+    The table is read once and reused for MOUNT_TABLE_TTL seconds.
+    """
+    global _MOUNT_TABLE, _MOUNT_TABLE_TIME
+    now = time.monotonic()
+    if _MOUNT_TABLE is not None and now - _MOUNT_TABLE_TIME < MOUNT_TABLE_TTL:
+        return _MOUNT_TABLE
+    mounts = {}
+    with open("/proc/self/mountinfo", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            fields, _, tail = line.partition(" - ")
+            fields = fields.split()
+            tail = tail.split()
+            if len(fields) < 5 or not tail:
+                continue
+            # Mount points escape whitespace and backslashes as octal
+            mount_point = (fields[4].replace("\\040", " ").replace("\\011", "\t")
+                           .replace("\\012", "\n").replace("\\134", "\\"))
+            mounts[mount_point] = tail[0]
+    _MOUNT_TABLE, _MOUNT_TABLE_TIME = mounts, now
+    return mounts
+
+
+def _is_remote_filesystem(root: str) -> bool:
+    """
+    Check whether the volume mounted at root is a network filesystem using metadata only:
+    /proc/self/mountinfo on Linux, statfs on macOS and GetDriveTypeW on Windows.
+    """
+    system = platform.system()
+    try:
+        if system == "Linux":
+            fstype = _linux_mounts().get(root, "")
+            return fstype in NETWORK_FS_TYPES or fstype.startswith("fuse")
+        if system == "Darwin":
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            try:
+                statfs = libc["statfs$INODE64"]  # Intel builds keep the 32-bit inode statfs as the default symbol
+            except AttributeError:
+                statfs = libc.statfs
+            info = _DarwinStatfs()
+            if statfs(os.fsencode(root), ctypes.byref(info)) != 0:
+                return False
+            return not info.f_flags & MNT_LOCAL or info.f_fstypename.decode() in NETWORK_FS_TYPES
+        if system == "Windows":
+            return ctypes.windll.kernel32.GetDriveTypeW(root.rstrip("\\/") + "\\") == DRIVE_REMOTE
+    except (OSError, AttributeError, ValueError):
+        pass
+    return False
+
+
+# Mount-level classification by (mount root, probe)
+_MOUNT_CACHE = {}
+
+
+def _is_network_mount(abs_path: str, probe: bool = False) -> bool:
+    """
+    Classify the volume containing abs_path by filesystem type, and optionally by write speed.
+    The result is cached per mount root, so sibling paths on the same volume reuse it.
+    """
+    root = _mount_root(abs_path)
+    cached = _MOUNT_CACHE.get((root, probe))
+    if cached is not None:
+        return cached
+
+    is_network = _is_remote_filesystem(root)
+
+    # Performance-based heuristic: Test write speed
+    # Network drives are typically slower, but the probe itself is slow on them, so it is opt-in
+    if not is_network and probe:
+        is_network = _is_slow_filesystem(abs_path)
+
+    _MOUNT_CACHE[(root, probe)] = is_network
+    return is_network
+
+
+def is_network_drive(path: str, probe: bool = False) -> bool:
     """
     Detect if a given path is on a network drive (Google Drive, OneDrive, network share, etc.).
+    Path-based indicators are checked on every call; the filesystem checks are cached per mount root.
     
     Args:
         path: Path to check.
+        probe: Also time a 1MB test write as a last resort (default: False).
         
     Returns:
         bool: True if the path is on a network drive, False otherwise.
     """
-    if not os.path.exists(path):
-        return False
-    
     try:
+        # Name-based checks are pure string work, so they run before any filesystem access
         abs_path = os.path.abspath(path)
         system = platform.system()
         
-        # Common network drive indicators
-        network_indicators = [
-            'google drive',
-            'googledrive',
-            'onedrive',
-            'dropbox',
-            'icloud',
-            'box sync',
-            'sharepoint',
-        ]
-        
         path_lower = abs_path.lower()
-        for indicator in network_indicators:
-            if indicator in path_lower:
-                return True
+        if any(indicator in path_lower for indicator in NETWORK_INDICATORS):
+            return True
         
         if system == "Darwin":  # macOS
             # Check if mounted volume
@@ -49,63 +170,20 @@ def is_network_drive(path: str) -> bool:
             # Check if Google Drive File Stream
             if '/Google Drive/' in abs_path or '/GoogleDrive/' in abs_path:
                 return True
-            
-            # Try to determine if it's a network mount using df command
-            try:
-                result = subprocess.run(
-                    ['df', abs_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                output = result.stdout.lower()
-                # Network filesystem types
-                if any(fs in output for fs in ['nfs', 'smb', 'cifs', 'afp', 'fuse', 'osxfuse']):
-                    return True
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                pass
         
         elif system == "Windows":
             # Check if UNC path
             if abs_path.startswith('\\\\'):
                 return True
-            
-            # Check if mapped network drive
-            try:
-                drive = abs_path.split(':')[0] + ':'
-                result = subprocess.run(
-                    ['net', 'use'],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                if drive in result.stdout:
-                    return True
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError, IndexError):
-                pass
         
         elif system == "Linux":
             # Check if in /mnt or /media
             if abs_path.startswith(('/mnt/', '/media/')):
                 return True
-            
-            # Try to determine filesystem type
-            try:
-                result = subprocess.run(
-                    ['df', '-T', abs_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                output = result.stdout.lower()
-                if any(fs in output for fs in ['nfs', 'cifs', 'smb', 'fuse']):
-                    return True
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                pass
         
-        # Performance-based heuristic: Test write speed
-        # Network drives are typically slower
-        return _is_slow_filesystem(path)
+        if not os.path.exists(abs_path):
+            return False
+        return _is_network_mount(abs_path, probe)
     
     except Exception:
         return False
@@ -157,12 +235,13 @@ def _is_slow_filesystem(path: str, threshold_mb_per_sec: float = 50.0) -> bool:
         return False
 
 
-def get_network_drive_info(path: str) -> dict:
+def get_network_drive_info(path: str, is_network: bool = None) -> dict:
     """
     Get information about whether a path is on a network drive and recommendations.
     
     Args:
         path: Path to check.
+        is_network: Result of an earlier is_network_drive(path) call; detected here if None.
         
     Returns:
         dict: Information about the path including:
@@ -170,7 +249,8 @@ def get_network_drive_info(path: str) -> dict:
             - warning_message: str (if applicable)
             - recommendation: str (if applicable)
     """
-    is_network = is_network_drive(path)
+    if is_network is None:
+        is_network = is_network_drive(path)
     
     info = {
         'is_network': is_network,
@@ -196,13 +276,15 @@ def get_network_drive_info(path: str) -> dict:
     return info
 
 
-def estimate_performance_impact(path: str, file_count: int) -> dict:
+def estimate_performance_impact(path: str, file_count: int, is_network: bool = None) -> dict:
     """
     Estimate the performance impact of using a network drive.
     
     Args:
         path: Path to check.
         file_count: Number of files to process.
+        is_network: Result of an earlier detection, e.g. get_network_drive_info(path)['is_network'];
+            detected here if None.
         
     Returns:
         dict: Performance estimates including:
@@ -211,7 +293,8 @@ def estimate_performance_impact(path: str, file_count: int) -> dict:
             - local_estimate_sec: float
             - network_estimate_sec: float
     """
-    is_network = is_network_drive(path)
+    if is_network is None:
+        is_network = is_network_drive(path)
     
     # Rough estimates based on typical performance characteristics
     # Local SSD: ~500 MB/s, Network: ~50 MB/s = 10x slower
@@ -1,11 +1,19 @@
 from PIL import Image
 import os
+import sys
 import shutil
 from pathlib import Path
 import subprocess
 import io
 import logging
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import cpu_count
+
+try:
+    import oxipng  # pyoxipng: optimizes PNG data in-process, without writing it out or spawning oxipng
+except ImportError:
+    oxipng = None
 
 logger = logging.getLogger(__name__)
 
@@ -13,266 +21,458 @@ MAX_PNG_SIZE = 1_048_576  # 1MB in bytes
 MIN_DIMENSION = 100       # Minimum width/height
 MAX_DIMENSION = 999      # Maximum width/height
 RESIZE_FACTORS = [0.9, 0.8, 0.7, 0.6, 0.5]  # Resize ratios
+JPEG_SIGNATURE = b"\xff\xd8\xff"  # Start of every JPEG file
+OXIPNG_PATH = shutil.which("oxipng")  # Looked up once; None when oxipng is not installed
+# Mode a newly created file gets from open(); tempfile creates its files owner-only (0600) instead.
+# The umask can only be read by setting it, which is safe here while the module is imported
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+NEW_FILE_MODE = 0o666 & ~_UMASK
+# Set TT_DEBUG_517C to trace illus_517_c* files through scanning and conversion at DEBUG level
+_DEBUG_517C = bool(os.environ.get("TT_DEBUG_517C"))
+if _DEBUG_517C:
+    # The app's logging setup usually drops DEBUG, so the trace gets its own level and handler, on stdout where
+    # it used to be printed. Worker processes import this module too and set up the same handler
+    logger.setLevel(logging.DEBUG)
+    _debug_handler = logging.StreamHandler(sys.stdout)
+    _debug_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    logger.addHandler(_debug_handler)
+    logger.propagate = False  # Keep the trace out of the app's log file and avoid printing it twice
+
+def _check_non_png(entry, relative_path, name_lower):
+    """
+    Check one file for a JPEG extension or a .png name over JPEG content.
+    name_lower is the lowercased file name, already computed while listing the directory.
+    Content is identified by its first three bytes, the JPEG SOI marker Pillow itself matches on.
+    Returns: (file_path, relative_path, reason) or None
+    """
+    file_path = entry.path
+    is_target_file = _DEBUG_517C and name_lower.startswith("illus_517_c")
+    if name_lower.endswith(".jpg") or name_lower.endswith(".jpeg"):
+        reason = "JPEG"
+        if is_target_file:
+            logger.debug(f"[Illus_517_C Debug] Found JPEG: {file_path}")
+    elif name_lower.endswith(".png"):
+        try:
+            # Raw open/read/close: only the three signature bytes are read, and unlike a file object
+            # there is no extra fstat, which costs a round-trip per file on network shares
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                signature = os.read(fd, 3)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            if is_target_file:
+                logger.debug(f"[Illus_517_C Debug] Failed to open {file_path}: {str(e)}")
+            return None
+        if signature != JPEG_SIGNATURE:
+            return None
+        reason = "PNG is JPEG"
+        if is_target_file:
+            logger.debug(f"[Illus_517_C Debug] Found PNG with JPEG content: {file_path}")
+    else:
+        return None
+    if is_target_file:
+        logger.debug(f"[Illus_517_C Debug] Added to list: {file_path} (Reason: {reason})")
+    return (file_path, relative_path, reason)
+
+def _scan_non_png_dir(path, relative_path, skip_folders, skip_files=False):
+    """
+    List one directory with os.scandir, collecting its JPEG and PNG files unless skip_files is set.
+    Subfolders named in skip_folders are left out, so they are never listed.
+    Returns: (list of (DirEntry, relative_path, lowercased name) candidates for its files, list of its subdirectory DirEntry objects)
+    """
+    candidates = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name_lower = entry.name.lower()
+                if entry.is_dir():
+                    if not entry.is_symlink() and name_lower not in skip_folders:
+                        subdirs.append(entry)
+                elif not skip_files and (name_lower.endswith(".png") or name_lower.endswith(".jpg") or name_lower.endswith(".jpeg")):
+                    candidates.append((entry, relative_path, name_lower))
+    except OSError as e:
+        logger.debug(f"Error scanning directory {path}: {str(e)}")
+    return candidates, subdirs
+
+def _scan_non_png_tree(path, relative_path, skip_folders):
+    """
+    Recursively list a directory tree in the order os.walk visits it: a folder's files, then each subfolder.
+    Returns: List of (DirEntry, relative_path, lowercased name) candidates
+    """
+    candidates, subdirs = _scan_non_png_dir(path, relative_path, skip_folders)
+    for entry in subdirs:
+        candidates.extend(_scan_non_png_tree(entry.path, relative_path + entry.name + "/", skip_folders))
+    return candidates
 
 def scan_non_png_images(directory_path: str) -> list:
     """
     Scan directory for non-PNG images (JPEG/JPG) and PNGs that are actually JPEGs, skipping LegacyTextTuring, out, and temp folders.
+    Skipped folders are pruned with everything below them; when the selected folder itself has one of those
+    names, only its own files are left out.
+    Top-level subfolders are listed on separate threads, then candidate files are checked on the same
+    threads, since the work is directory listing and 3-byte reads that mostly wait on the disk or network.
     Returns: List of (file_path, relative_path, reason)
     """
     
-    image_files = []
     skip_folders = {"legacytextturing", "out", "temp"}
-    for root, _, files in os.walk(directory_path, topdown=True):
-        if os.path.basename(root).lower() in skip_folders:
-            continue
+    candidates, subdirs = _scan_non_png_dir(directory_path, "", skip_folders, os.path.basename(directory_path).lower() in skip_folders)
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as executor:
+        # map keeps input order, so candidates and results come back in os.walk order
+        subtrees = executor.map(lambda entry: _scan_non_png_tree(entry.path, entry.name + "/", skip_folders), subdirs)
+        for subtree_candidates in subtrees:
+            candidates.extend(subtree_candidates)
+        # .jpg/.jpeg files are decided by name alone; each .png needs its signature read
+        results = executor.map(lambda candidate: _check_non_png(*candidate), candidates)
+        return [result for result in results if result]
+
+def _encode_png(img, temp_dir, is_target_file=False):
+    """
+    Encode an image as final PNG data: optimized in memory by pyoxipng when installed, otherwise by the
+    oxipng executable on a temporary file in temp_dir, otherwise at Pillow's strongest zlib level.
+    Returns: PNG data as bytes
+    """
+    oxipng_available = oxipng is not None or OXIPNG_PATH is not None
+    buffer = io.BytesIO()
+    # oxipng recompresses the whole stream anyway, so a fast zlib pass is enough before it;
+    # without oxipng, Pillow's output is final and gets the strongest level
+    img.save(buffer, format='PNG', compress_level=1 if oxipng_available else 9, optimize=False)
+    if oxipng is not None:
+        if is_target_file:
+            logger.debug(f"[Illus_517_C Debug] Optimizing PNG with pyoxipng in memory")
+        return oxipng.optimize_from_memory(buffer.getvalue(), level=6, strip=oxipng.StripChunks.all())
+    if OXIPNG_PATH is None:
+        return buffer.getvalue()
+
+    with tempfile.NamedTemporaryFile(delete=False, dir=temp_dir, prefix=".", suffix=".png") as temp_file:
+        temp_file.write(buffer.getbuffer())
+    os.chmod(temp_file.name, NEW_FILE_MODE)
+    try:
         try:
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_name = os.path.basename(file_path)
-                relative_path = os.path.relpath(root, directory_path).replace(os.sep, "/")
-                if relative_path == ".":
-                    relative_path = ""
-                else:
-                    relative_path += "/"
-                reason = None
-                if file.lower().endswith((".jpg", ".jpeg")):
-                    reason = "JPEG"
-                    if file_name.lower().startswith("illus_517_c"):
-                        print(f"[Illus_517_C Debug] Found JPEG: {file_path}")
-                elif file.lower().endswith(".png"):
-                    try:
-                        with Image.open(file_path) as img:
-                            if img.format in ("JPEG", "JPG"):
-                                reason = "PNG is JPEG"
-                                if file_name.lower().startswith("illus_517_c"):
-                                    print(f"[Illus_517_C Debug] Found PNG with JPEG content: {file_path}, Format: {img.format}, Size: {img.size}")
-                    except Exception as e:
-                        if file_name.lower().startswith("illus_517_c"):
-                            print(f"[Illus_517_C Debug] Failed to open {file_path}: {str(e)}")
-                        continue
-                if reason:
-                    image_files.append((file_path, relative_path, reason))
-                    if file_name.lower().startswith("illus_517_c"):
-                        print(f"[Illus_517_C Debug] Added to list: {file_path} (Reason: {reason})")
-        except Exception as e:
-            if any(file.lower().startswith("illus_517_c") for file in files):
-                print(f"[Illus_517_C Debug] Error scanning directory {root}: {str(e)}")
-            continue
-    return image_files
+            if is_target_file:
+                logger.debug(f"[Illus_517_C Debug] Optimizing PNG with oxipng: {temp_file.name}")
+            subprocess.run([OXIPNG_PATH, "--opt", "max", "--strip", "all", temp_file.name], check=True, capture_output=True)
+            if is_target_file:
+                logger.debug(f"[Illus_517_C Debug] Oxipng optimization completed.")
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            if is_target_file:
+                logger.debug(f"[Illus_517_C Debug] Oxipng failed or not found: {str(e)}")
+        with open(temp_file.name, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(temp_file.name)
 
 def convert_to_png(file_path: str, parent_dir: str) -> tuple:
     """
     Convert a JPEG/JPG or misidentified PNG to proper PNG, ensuring size ≤1MB and width/height ≤999 pixels.
-    Copies original to temp, moves to LegacyTextTuring/Graphics only after verifying PNG, skipping if exists.
-    Returns: (new_file_path: str, error: str)
+    The original ends up in LegacyTextTuring/Graphics, which is skipped if a backup already exists there, and is put
+    back in place if the conversion fails.
+    Log.txt is left to the caller, so a batch can be logged in one write.
+    Returns: (new_file_path: str, error: str, log_line: str), log_line being the Log.txt entry for a successful conversion
     """
     file_name = os.path.basename(file_path)
-    is_target_file = file_name.lower().startswith("illus_517_c")
+    is_target_file = _DEBUG_517C and file_name.lower().startswith("illus_517_c")
     if is_target_file:
-        print(f"[Illus_517_C Debug] Starting conversion for: {file_path}")
-    temp_original = None
+        logger.debug(f"[Illus_517_C Debug] Starting conversion for: {file_path}")
+    backup_made = False
+    temp_png = None
     try:
         if not os.path.exists(file_path):
             if is_target_file:
-                print(f"[Illus_517_C Debug] File does not exist: {file_path}")
-            return None, "File not found"
+                logger.debug(f"[Illus_517_C Debug] File does not exist: {file_path}")
+            return None, "File not found", None
         if not os.access(file_path, os.R_OK):
             if is_target_file:
-                print(f"[Illus_517_C Debug] No read permission for: {file_path}")
-            return None, "No read permission"
+                logger.debug(f"[Illus_517_C Debug] No read permission for: {file_path}")
+            return None, "No read permission", None
 
         # Create LegacyTextTuring/Graphics folder
         legacy_folder = os.path.join(parent_dir, "LegacyTextTuring")
         graphics_folder = os.path.join(legacy_folder, "Graphics")
-        log_file = os.path.join(legacy_folder, "Log.txt")
         if is_target_file:
-            print(f"[Illus_517_C Debug] Creating backup folder: {graphics_folder}")
+            logger.debug(f"[Illus_517_C Debug] Creating backup folder: {graphics_folder}")
         os.makedirs(graphics_folder, exist_ok=True)
         dest_path = os.path.join(graphics_folder, file_name)
         if is_target_file:
-            print(f"[Illus_517_C Debug] Backup destination: {dest_path}")
+            logger.debug(f"[Illus_517_C Debug] Backup destination: {dest_path}")
 
         # Check if backup already exists
         if os.path.exists(dest_path):
             if is_target_file:
-                print(f"[Illus_517_C Debug] Backup already exists at {dest_path}. Removing original.")
+                logger.debug(f"[Illus_517_C Debug] Backup already exists at {dest_path}. Removing original.")
             os.remove(file_path)
-            return None, "Backup already exists"
+            return None, "Backup already exists", None
 
-        # Copy original to temp location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file_name)[1]) as temp_file:
-            temp_original = temp_file.name
-            if is_target_file:
-                print(f"[Illus_517_C Debug] Copying original to temp: {temp_original}")
-            shutil.copy2(file_path, temp_original)
+        # New PNG path
+        new_file_path = os.path.splitext(file_path)[0] + ".png"
+        if is_target_file:
+            logger.debug(f"[Illus_517_C Debug] New PNG path: {new_file_path}")
+
+        # A .png that is really a JPEG is replaced by its converted data, so it is backed up once it has loaded.
+        # Any other original, including an .PNG on a case-sensitive file system, stays untouched until it is moved
+        # into the backup folder itself. Comparing the files rather than the names keeps a case-insensitive file
+        # system, where the .png path is the original, on the replace path.
+        overwrites_original = new_file_path == file_path or (
+            os.path.exists(new_file_path) and os.path.samefile(new_file_path, file_path))
 
         # Load image
         try:
             if is_target_file:
-                print(f"[Illus_517_C Debug] Loading image: {file_path}")
+                logger.debug(f"[Illus_517_C Debug] Loading image: {file_path}")
             img = Image.open(file_path)
-            if img.mode != 'RGB':
+            # Resize targets are worked out from the stored size, whatever scale the pixels are decoded at
+            original_width, original_height = img.size
+            passthrough_data = None
+            if (img.format == "PNG" and not overwrites_original and max(img.size) <= MAX_DIMENSION
+                    and os.path.getsize(file_path) <= MAX_PNG_SIZE):
+                # A .jpg/.jpeg that already holds a small enough PNG only needs renaming, so its data is kept
+                # without decoding it; pyoxipng, when installed, just strips the ancillary chunks
                 if is_target_file:
-                    print(f"[Illus_517_C Debug] Converting image mode to RGB from {img.mode}")
-                img = img.convert('RGB')
-            img.info.pop('icc_profile', None)
+                    logger.debug(f"[Illus_517_C Debug] PNG content already within limits, keeping its data")
+                with open(file_path, "rb") as f:
+                    passthrough_data = f.read()
+                if oxipng is not None:
+                    passthrough_data = oxipng.optimize_from_memory(passthrough_data, level=1, strip=oxipng.StripChunks.safe())
+            else:
+                if img.format == "JPEG" and max(img.size) > MAX_DIMENSION:
+                    # Let libjpeg decode at 1/2, 1/4 or 1/8 scale, never below MAX_DIMENSION on either side
+                    img.draft('RGB', (MAX_DIMENSION, MAX_DIMENSION))
+                    if is_target_file:
+                        logger.debug(f"[Illus_517_C Debug] JPEG draft decode size: {img.size}")
+                if img.mode != 'RGB':
+                    if is_target_file:
+                        logger.debug(f"[Illus_517_C Debug] Converting image mode to RGB from {img.mode}")
+                    img = img.convert('RGB')
+                img.info.pop('icc_profile', None)
             if is_target_file:
-                print(f"[Illus_517_C Debug] Image loaded successfully. Size: {img.size}")
+                logger.debug(f"[Illus_517_C Debug] Image loaded successfully. Size: {img.size}")
         except Exception as e:
             if is_target_file:
-                print(f"[Illus_517_C Debug] Failed to load image {file_path}: {str(e)}")
-            return None, f"Unidentified or unsupported image format: {str(e)}"
+                logger.debug(f"[Illus_517_C Debug] Failed to load image {file_path}: {str(e)}")
+            return None, f"Unidentified or unsupported image format: {str(e)}", None
 
-        # Initial dimensions
-        original_width, original_height = img.size
-        if is_target_file:
-            print(f"[Illus_517_C Debug] Original dimensions: {original_width}x{original_height}")
+        # Back up an original that is about to be replaced. A hard link copies no data; the PNG is later
+        # swapped in with os.replace, so the linked original is never touched. Done only now, so an image
+        # that fails to load leaves no backup behind, which the next run would take as already converted
+        if overwrites_original:
+            try:
+                os.link(file_path, dest_path)
+                if is_target_file:
+                    logger.debug(f"[Illus_517_C Debug] Linked original to backup: {dest_path}")
+            except OSError:
+                # Other file system, or no hard link support
+                if is_target_file:
+                    logger.debug(f"[Illus_517_C Debug] Copying original to backup: {dest_path}")
+                shutil.copy2(file_path, dest_path)
+            backup_made = True
 
-        # New PNG path
-        new_file_path = os.path.splitext(file_path)[0] + ".png"
+        # Initial dimensions
         if is_target_file:
-            print(f"[Illus_517_C Debug] New PNG path: {new_file_path}")
+            logger.debug(f"[Illus_517_C Debug] Original dimensions: {original_width}x{original_height}")
 
         # Calculate initial resize factor to ensure width and height ≤ 999 pixels
         max_current_dimension = max(original_width, original_height)
         if max_current_dimension > MAX_DIMENSION:
             initial_resize_factor = MAX_DIMENSION / max_current_dimension
             if is_target_file:
-                print(f"[Illus_517_C Debug] Initial resize factor to meet 999px limit: {initial_resize_factor}")
+                logger.debug(f"[Illus_517_C Debug] Initial resize factor to meet 999px limit: {initial_resize_factor}")
         else:
             initial_resize_factor = 1.0
             if is_target_file:
-                print(f"[Illus_517_C Debug] No initial resize needed for dimensions")
+                logger.debug(f"[Illus_517_C Debug] No initial resize needed for dimensions")
 
         # Combine resize factors
         resize_factors = [initial_resize_factor] if initial_resize_factor < 1.0 else [1.0]
         resize_factors.extend([f for f in RESIZE_FACTORS if f < initial_resize_factor])
 
-        # Try saving PNG with progressive resizing
+        # Target size per factor, stopping at the first one that falls below the minimum dimension
+        attempts = []
         for resize_factor in resize_factors:
+            if resize_factor < 1.0:
+                new_width = int(original_width * resize_factor)
+                new_height = int(original_height * resize_factor)
+                if new_width < MIN_DIMENSION or new_height < MIN_DIMENSION:
+                    if is_target_file:
+                        logger.debug(f"[Illus_517_C Debug] Dimensions too small: {new_width}x{new_height}. Stopping resize.")
+                    break
+                attempts.append((resize_factor, (new_width, new_height)))
+            else:
+                attempts.append((resize_factor, None))
+
+        base_img = None  # The first attempt's image; smaller attempts are resized from it
+
+        def encode_attempt(index):
+            """Encode attempt index as final PNG data, or return None if it stays over MAX_PNG_SIZE or fails."""
+            nonlocal base_img
+            resize_factor, size = attempts[index]
             try:
                 if is_target_file:
-                    print(f"[Illus_517_C Debug] Attempting resize factor: {resize_factor}")
-                # Resize if not first attempt or required for dimensions
-                if resize_factor < 1.0:
-                    new_width = int(original_width * resize_factor)
-                    new_height = int(original_height * resize_factor)
-                    if new_width < MIN_DIMENSION or new_height < MIN_DIMENSION:
-                        if is_target_file:
-                            print(f"[Illus_517_C Debug] Dimensions too small: {new_width}x{new_height}. Stopping resize.")
-                        break
+                    logger.debug(f"[Illus_517_C Debug] Attempting resize factor: {resize_factor}")
+                if size:
                     if is_target_file:
-                        print(f"[Illus_517_C Debug] Resizing to: {new_width}x{new_height}")
-                    img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                        logger.debug(f"[Illus_517_C Debug] Resizing to: {size[0]}x{size[1]}")
+                    img_resized = (img if base_img is None else base_img).resize(size, Image.Resampling.LANCZOS)
                 else:
                     img_resized = img
+                if base_img is None:
+                    base_img = img_resized
 
-                # Save PNG
+                png_data = _encode_png(img_resized, os.path.dirname(new_file_path), is_target_file)
                 if is_target_file:
-                    print(f"[Illus_517_C Debug] Saving PNG to: {new_file_path}")
-                img_resized.save(new_file_path, format='PNG', compress_level=9)
+                    logger.debug(f"[Illus_517_C Debug] PNG size: {len(png_data)} bytes ({len(png_data) / (1024 * 1024):.2f} MB)")
+                if len(png_data) > MAX_PNG_SIZE:
+                    if is_target_file:
+                        logger.debug(f"[Illus_517_C Debug] PNG size exceeds limit: {len(png_data)} bytes.")
+                    return None
+                return png_data
+            except Exception as e:
                 if is_target_file:
-                    print(f"[Illus_517_C Debug] PNG saved successfully.")
+                    logger.debug(f"[Illus_517_C Debug] Error processing {file_path} at resize factor {resize_factor}: {str(e)}")
+                logger.error(f"Error processing {file_path} at resize_factor {resize_factor}: {str(e)}")
+                return None
 
-                # Optimize with oxipng if available
-                try:
-                    if is_target_file:
-                        print(f"[Illus_517_C Debug] Optimizing PNG with oxipng: {new_file_path}")
-                    subprocess.run(["oxipng", "--opt", "max", "--strip", "all", new_file_path], check=True, capture_output=True)
-                    if is_target_file:
-                        print(f"[Illus_517_C Debug] Oxipng optimization completed.")
-                except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                    if is_target_file:
-                        print(f"[Illus_517_C Debug] Oxipng failed or not found: {str(e)}")
+        # Most images fit at the first (largest) factor. Otherwise PNG size shrinks with the factor, so
+        # binary-search the rest for the largest one that fits: the same pick as trying them in order,
+        # in about log2(n) encodes instead of up to n
+        best_data = passthrough_data
+        if best_data is None and attempts:
+            best_data = encode_attempt(0)
+        if best_data is None:
+            lo, hi = 1, len(attempts) - 1
+            while lo <= hi:
+                mid = (lo + hi) // 2
+                png_data = encode_attempt(mid)
+                if png_data is None:
+                    lo = mid + 1
+                else:
+                    best_data = png_data
+                    hi = mid - 1
+
+        png_written = False
+        if best_data is not None:
+            try:
+                # Save PNG
+                if is_target_file:
+                    logger.debug(f"[Illus_517_C Debug] Saving PNG to: {new_file_path}")
+                with tempfile.NamedTemporaryFile(delete=False, dir=os.path.dirname(new_file_path), prefix=".", suffix=".png") as temp_file:
+                    temp_png = temp_file.name
+                    temp_file.write(best_data)
+                # Give the PNG the mode writing it directly would have: the replaced original's, or a new file's
+                if overwrites_original:
+                    shutil.copymode(file_path, temp_png)
+                else:
+                    os.chmod(temp_png, NEW_FILE_MODE)
+                os.replace(temp_png, new_file_path)
+                png_written = True
+                if is_target_file:
+                    logger.debug(f"[Illus_517_C Debug] PNG saved successfully.")
 
                 # Verify PNG exists and is readable
                 if not os.path.exists(new_file_path):
                     if is_target_file:
-                        print(f"[Illus_517_C Debug] PNG not found after saving: {new_file_path}")
+                        logger.debug(f"[Illus_517_C Debug] PNG not found after saving: {new_file_path}")
                     raise FileNotFoundError(f"PNG file missing: {new_file_path}")
                 if not os.access(new_file_path, os.R_OK):
                     if is_target_file:
-                        print(f"[Illus_517_C Debug] No read permission for PNG: {new_file_path}")
+                        logger.debug(f"[Illus_517_C Debug] No read permission for PNG: {new_file_path}")
                     raise PermissionError(f"No read permission for PNG: {new_file_path}")
 
-                # Check PNG size
-                png_size = os.path.getsize(new_file_path)
-                if is_target_file:
-                    print(f"[Illus_517_C Debug] PNG size: {png_size} bytes ({png_size / (1024 * 1024):.2f} MB)")
-                if png_size <= MAX_PNG_SIZE:
-                    # Move temp original to LegacyTextTuring/Graphics
-                    if is_target_file:
-                        print(f"[Illus_517_C Debug] Moving temp original to: {dest_path}")
-                    shutil.move(temp_original, dest_path)
+                # Move the original to LegacyTextTuring/Graphics, unless it was backed up before being replaced
+                if not backup_made:
                     if is_target_file:
-                        print(f"[Illus_517_C Debug] Original moved successfully.")
-                    # Remove original file only if it's different from new PNG path
-                    if file_path != new_file_path and os.path.exists(file_path):
-                        if is_target_file:
-                            print(f"[Illus_517_C Debug] Removing original: {file_path}")
-                        os.remove(file_path)
-                    # Log conversion
-                    log_path = "Accessing CloudVision Appliance/" + file_name
-                    try:
-                        if is_target_file:
-                            print(f"[Illus_517_C Debug] Logging conversion to: {log_file}")
-                        with open(log_file, "a", encoding="utf-8") as f:
-                            from check_image_sanity import CheckImageSanityWidget
-                            if CheckImageSanityWidget.first_conversion:
-                                f.write("--------------\nImages Converted\n")
-                                CheckImageSanityWidget.first_conversion = False
-                            f.write(f"{log_path} - converted to png\n")
-                        if is_target_file:
-                            print(f"[Illus_517_C Debug] Conversion logged successfully.")
-                    except Exception as e:
-                        if is_target_file:
-                            print(f"[Illus_517_C Debug] Error logging conversion for {file_path}: {str(e)}")
-                        logger.error(f"Error logging conversion for {file_path}: {str(e)}")
-                    if is_target_file:
-                        print(f"[Illus_517_C Debug] Conversion successful for: {new_file_path}")
-                    return new_file_path, None
-                else:
+                        logger.debug(f"[Illus_517_C Debug] Moving original from {file_path} to: {dest_path}")
+                    shutil.move(file_path, dest_path)
                     if is_target_file:
-                        print(f"[Illus_517_C Debug] PNG size exceeds limit: {png_size} bytes. Deleting: {new_file_path}")
-                    os.remove(new_file_path)
+                        logger.debug(f"[Illus_517_C Debug] Original moved successfully.")
+                if is_target_file:
+                    logger.debug(f"[Illus_517_C Debug] Conversion successful for: {new_file_path}")
+                return new_file_path, None, f"Accessing CloudVision Appliance/{file_name} - converted to png\n"
             except Exception as e:
-                if os.path.exists(new_file_path):
-                    if is_target_file:
-                        print(f"[Illus_517_C Debug] Error during processing. Deleting: {new_file_path}")
-                    os.remove(new_file_path)
                 if is_target_file:
-                    print(f"[Illus_517_C Debug] Error processing {file_path} at resize factor {resize_factor}: {str(e)}")
-                logger.error(f"Error processing {file_path} at resize_factor {resize_factor}: {str(e)}")
-                continue
+                    logger.debug(f"[Illus_517_C Debug] Error saving {new_file_path}: {str(e)}")
+                logger.error(f"Error saving {new_file_path}: {str(e)}")
+
+            if png_written and os.path.exists(new_file_path):
+                if is_target_file:
+                    logger.debug(f"[Illus_517_C Debug] Error during processing. Deleting: {new_file_path}")
+                os.remove(new_file_path)
 
         # If all attempts fail, restore original
         if is_target_file:
-            print(f"[Illus_517_C Debug] Conversion failed for {file_path}: PNG size exceeds 1MB or dimensions not met")
+            logger.debug(f"[Illus_517_C Debug] Conversion failed for {file_path}: PNG size exceeds 1MB or dimensions not met")
         if os.path.exists(file_path):
             if is_target_file:
-                print(f"[Illus_517_C Debug] Original still exists: {file_path}")
-        else:
+                logger.debug(f"[Illus_517_C Debug] Original still exists: {file_path}")
+            if backup_made:
+                os.remove(dest_path)
+        elif backup_made:
             if is_target_file:
-                print(f"[Illus_517_C Debug] Restoring original from temp: {temp_original} to {file_path}")
-            shutil.move(temp_original, file_path)
-        return None, "PNG size exceeds 1MB or dimensions not met"
+                logger.debug(f"[Illus_517_C Debug] Restoring original from backup: {dest_path} to {file_path}")
+            shutil.move(dest_path, file_path)
+        return None, "PNG size exceeds 1MB or dimensions not met", None
 
     except Exception as e:
         if is_target_file:
-            print(f"[Illus_517_C Debug] Unexpected error processing {file_path}: {str(e)}")
+            logger.debug(f"[Illus_517_C Debug] Unexpected error processing {file_path}: {str(e)}")
         logger.error(f"Unexpected error processing {file_path}: {str(e)}")
-        # Restore original if it was copied
-        if temp_original and os.path.exists(temp_original) and not os.path.exists(file_path):
-            if is_target_file:
-                print(f"[Illus_517_C Debug] Restoring original from temp: {temp_original} to {file_path}")
-            shutil.move(temp_original, file_path)
-        return None, f"Unexpected error: {str(e)}"
+        # Restore original if it was backed up, or drop the backup if the original is still in place
+        if backup_made and os.path.exists(dest_path):
+            if not os.path.exists(file_path):
+                if is_target_file:
+                    logger.debug(f"[Illus_517_C Debug] Restoring original from backup: {dest_path} to {file_path}")
+                shutil.move(dest_path, file_path)
+            else:
+                os.remove(dest_path)
+        return None, f"Unexpected error: {str(e)}", None
     finally:
         # Clean up temp file if it exists
-        if temp_original and os.path.exists(temp_original):
+        if temp_png and os.path.exists(temp_png):
             if is_target_file:
-                print(f"[Illus_517_C Debug] Cleaning up temp file: {temp_original}")
-            os.remove(temp_original)
+                logger.debug(f"[Illus_517_C Debug] Cleaning up temp file: {temp_png}")
+            os.remove(temp_png)
+
+def convert_many(file_paths: list, parent_dir: str, use_multiprocessing: bool = True) -> list:
+    """
+    Convert several images with convert_to_png, spreading them over worker processes.
+    Each conversion is CPU-bound (resize and DEFLATE), so workers run them side by side. Images with the same file
+    name share one backup path in LegacyTextTuring/Graphics, so they are converted in successive rounds, never at
+    the same time. A conversion whose worker fails is reported as an error on its own; the others keep their results.
+    Returns: list of (new_file_path: str, error: str, log_line: str), in the order of file_paths
+    """
+    if not (use_multiprocessing and len(file_paths) > 1):
+        return [convert_to_png(file_path, parent_dir) for file_path in file_paths]
+
+    # Round n holds the n-th image of each file name, compared case-insensitively like the file systems that do
+    rounds = []
+    name_counts = {}
+    for index, file_path in enumerate(file_paths):
+        name = os.path.basename(file_path).lower()
+        round_index = name_counts.get(name, 0)
+        name_counts[name] = round_index + 1
+        if round_index == len(rounds):
+            rounds.append([])
+        rounds[round_index].append(index)
+
+    results = [None] * len(file_paths)
+    max_workers = min(cpu_count(), len(rounds[0]))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for indexes in rounds:
+            futures = []
+            for index in indexes:
+                try:
+                    futures.append((index, executor.submit(convert_to_png, file_paths[index], parent_dir)))
+                except Exception as e:  # The pool broke in an earlier round
+                    logger.error(f"Conversion of {file_paths[index]} could not be started: {str(e)}")
+                    results[index] = (None, f"Conversion failed: {str(e)}", None)
+            for index, future in futures:
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.error(f"Conversion of {file_paths[index]} failed in its worker: {str(e)}")
+                    results[index] = (None, f"Conversion failed: {str(e)}", None)
+    return results
 
 if __name__ == "__main__":
-    exit(1)
\ No newline at end of file
+    exit(1)
@@ -1,9 +1,75 @@
 from PyQt6.QtWidgets import QFileDialog, QWidget
 import os
+import re
 import time
 from lxml import etree
 from urllib.parse import unquote, quote
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import cpu_count
+
+# Compiled once and evaluated against every parsed file
+XPATH_ID_ELEMENTS = etree.XPath("//*[@id]")
+XPATH_FRAGMENT_XREFS = etree.XPath("//xref[starts-with(@href, '#')]")  # Same-file references only
+XPATH_REF_ELEMENTS = etree.XPath("//xref[@href]|//topicref[@href]")
+
+def _collect_ids(file_path):
+    """
+    Stream a file with iterparse and collect its IDs without keeping the tree in memory, along with
+    the IDs its cross-file xref/topicref hrefs point at.
+
+    Returns:
+        Tuple: (top_id, nested_ids, ref_ids) where top_id is the root element's id (or None), nested_ids lists
+        every other element id different from top_id, in document order, and ref_ids is the set of ID parts
+        after '#' in hrefs to other files; None if the file cannot be parsed.
+    """
+    top_id = None
+    nested_ids = []
+    ref_ids = set()
+    is_root = True
+    try:
+        for event, elem in etree.iterparse(file_path, events=("start", "end")):
+            if event == "start":
+                elem_id = elem.get('id')
+                if is_root:
+                    top_id = elem_id
+                    is_root = False
+                elif elem_id is not None and elem_id != top_id:
+                    nested_ids.append(elem_id)
+                if elem.tag == 'xref' or elem.tag == 'topicref':
+                    href = elem.get('href')
+                    if href and '#' in href and not href.startswith('#'):
+                        ref_ids.update(href.split('#', 1)[1].split('/', 1))
+            else:
+                # Attributes were read on start; drop the children of finished elements
+                elem.clear(keep_tail=True)
+    except etree.LxmlError:
+        return None
+    return top_id, nested_ids, ref_ids
+
+def _iter_xml_files(path):
+    """
+    Recursively yield the .xml and .dita files under path with os.scandir, in the order os.walk visits them:
+    a folder's files, then each subfolder. Paths are built from path with '/' separators. Folders whose names
+    contain 'LegacyTextTuring' are never listed, symlinked folders are not followed and unreadable folders
+    are skipped, as os.walk does.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path or '/') as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    if not entry.is_symlink() and 'LegacyTextTuring' not in name:
+                        subdirs.append(name)
+                elif name.endswith(".xml") or name.endswith(".dita"):
+                    files.append(f"{path}/{name}")
+    except OSError:
+        return
+    yield from files
+    for name in subdirs:
+        yield from _iter_xml_files(f"{path}/{name}")
 
 def remove_duplicate_ids(parent: QWidget, dir_path: str = None) -> tuple[int, int, bool]:
     """
@@ -54,12 +120,10 @@ def remove_duplicate_ids(parent: QWidget, dir_path: str = None) -> tuple[int, in
     xml_files = []
     ditamap_files = []
     try:
-        for root, _, files in os.walk(dir_path):
-            if 'LegacyTextTuring' in root:
-                continue
-            for file in files:
-                if file.endswith((".xml", ".dita")):
-                    xml_files.append(os.path.abspath(os.path.join(root, file)).replace('\\', '/'))
+        if 'LegacyTextTuring' not in dir_path:
+            # Resolved once; every path below is built from it
+            abs_root = os.path.abspath(dir_path).replace('\\', '/').rstrip('/')
+            xml_files.extend(_iter_xml_files(abs_root))
         if os.path.exists(parent_dir) and 'LegacyTextTuring' not in parent_dir:
             for file in os.listdir(parent_dir):
                 if file.endswith(".ditamap"):
@@ -76,21 +140,20 @@ def remove_duplicate_ids(parent: QWidget, dir_path: str = None) -> tuple[int, in
     # Collect IDs
     top_id_map = {}
     nested_id_map = {}
-    for file_path in xml_files:
-        try:
-            tree = etree.parse(file_path)
-            root = tree.getroot()
-            top_id = root.get('id')
-            if top_id:
-                top_id_map.setdefault(top_id, []).append(file_path)
-            for elem in tree.xpath("//*[@id]"):
-                elem_id = elem.get('id')
-                if elem_id != top_id:
-                    nested_id_map.setdefault(elem_id, []).append((file_path, top_id or ''))
-        except etree.LxmlError:
+    # Files are read and parsed on worker threads, which overlaps their I/O; merging into the maps stays
+    # on this thread, in xml_files order, so duplicates are numbered exactly as before
+    with ThreadPoolExecutor(max_workers=max(1, min(cpu_count(), len(xml_files)))) as executor:
+        collected = list(executor.map(_collect_ids, xml_files))
+    for file_path, file_ids in zip(xml_files, collected):
+        if file_ids is None:
             continue
+        top_id, nested_ids, _ = file_ids
+        if top_id:
+            top_id_map.setdefault(top_id, []).append(file_path)
+        for elem_id in nested_ids:
+            nested_id_map.setdefault(elem_id, []).append((file_path, top_id or ''))
 
-    # Process duplicates
+    # Process duplicates; rename_map maps (file_path, orig_id) to the new ID
     rename_map = {}
     modified_files = set()
     all_ids = set(top_id_map.keys()).union(nested_id_map.keys())
@@ -105,7 +168,7 @@ def remove_duplicate_ids(parent: QWidget, dir_path: str = None) -> tuple[int, in
                 while new_id in all_ids:
                     n += 1
                     new_id = f"ttu_{orig_id}_{n}"
-                rename_map.setdefault(orig_id, {})[file_path] = new_id
+                rename_map[(file_path, orig_id)] = new_id
                 all_ids.add(new_id)
                 modified_files.add(file_path)
                 duplicates_fixed += 1
@@ -123,13 +186,15 @@ def remove_duplicate_ids(parent: QWidget, dir_path: str = None) -> tuple[int, in
                     while new_id in all_ids:
                         n += 1
                         new_id = f"ttu_{orig_id}_{n}"
-                    rename_map.setdefault(orig_id, {})[file_path] = new_id
+                    rename_map[(file_path, orig_id)] = new_id
                     all_ids.add(new_id)
                     modified_files.add(file_path)
                     duplicates_fixed += 1
 
-    # Update files (IDs and internal references)
-    files_modified = 0
+    # Update files (IDs and internal references). Changed trees are kept in memory and written once at the end,
+    # so a file changed by both passes is parsed and serialized only once
+    changed_trees = {}
+    change_counts = {}  # Passes that changed each file, for files_modified
     files_with_link_changes = set()
     for file_path in modified_files:
         try:
@@ -138,34 +203,34 @@ def remove_duplicate_ids(parent: QWidget, dir_path: str = None) -> tuple[int, in
             modified = False
 
             orig_top_id = root.get('id')
-            if orig_top_id in rename_map and file_path in rename_map[orig_top_id]:
-                new_id = rename_map[orig_top_id][file_path]
-                root.set('id', new_id)
+            new_top_id = rename_map.get((file_path, orig_top_id))
+            if new_top_id is not None:
+                root.set('id', new_top_id)
                 modified = True
 
-            for elem in tree.xpath("//*[@id]"):
-                elem_id = elem.get('id')
-                if elem_id in rename_map and file_path in rename_map[elem_id]:
-                    new_id = rename_map[elem_id][file_path]
+            for elem in XPATH_ID_ELEMENTS(tree):
+                new_id = rename_map.get((file_path, elem.get('id')))
+                if new_id is not None:
                     elem.set('id', new_id)
                     modified = True
 
-            for xref in tree.xpath("//xref[@href]"):
+            for xref in XPATH_FRAGMENT_XREFS(tree):
                 href = xref.get('href')
                 new_href = href
-                if href.startswith('#'):
-                    if '/' in href:
-                        parts = href[1:].split('/', 1)
-                        if len(parts) == 2:
-                            top_id, nested_id = parts
-                            if top_id == orig_top_id and orig_top_id in rename_map and file_path in rename_map[orig_top_id]:
-                                new_href = f"#{rename_map[orig_top_id][file_path]}/{nested_id}"
-                            if nested_id in rename_map and file_path in rename_map[nested_id]:
-                                new_href = f"#{top_id if new_href == href else rename_map[orig_top_id][file_path]}/{rename_map[nested_id][file_path]}"
-                    else:
-                        href_id = href[1:]
-                        if href_id in rename_map and file_path in rename_map[href_id]:
-                            new_href = f"#{rename_map[href_id][file_path]}"
+                if '/' in href:
+                    parts = href[1:].split('/', 1)
+                    if len(parts) == 2:
+                        top_id, nested_id = parts
+                        renamed_top = new_top_id is not None and top_id == orig_top_id
+                        if renamed_top:
+                            new_href = f"#{new_top_id}/{nested_id}"
+                        new_nested_id = rename_map.get((file_path, nested_id))
+                        if new_nested_id is not None:
+                            new_href = f"#{new_top_id if renamed_top else top_id}/{new_nested_id}"
+                else:
+                    new_id = rename_map.get((file_path, href[1:]))
+                    if new_id is not None:
+                        new_href = f"#{new_id}"
                 if new_href != href:
                     xref.set('href', new_href)
                     files_with_link_changes.add(file_path)
@@ -179,10 +244,8 @@ def remove_duplicate_ids(parent: QWidget, dir_path: str = None) -> tuple[int, in
                     if not os.path.exists(backup_path):
                         os.makedirs(os.path.dirname(backup_path), exist_ok=True)
                         shutil.copy2(file_path, backup_path)
-                tree.write(file_path, encoding=tree.docinfo.encoding,
-                         doctype=tree.docinfo.doctype, pretty_print=False,
-                         xml_declaration=True)
-                files_modified += 1
+                changed_trees[file_path] = tree
+                change_counts[file_path] = 1
 
         except etree.LxmlError:
             continue
@@ -197,33 +260,47 @@ def remove_duplicate_ids(parent: QWidget, dir_path: str = None) -> tuple[int, in
 
     # Update cross-file references
     header_written = False
-    for file_path in xml_files + ditamap_files:
+    # Only files whose cross-file hrefs name a renamed ID can change here; the few ditamaps are always checked
+    renamed_ids = {orig_id for _, orig_id in rename_map}
+    referencing_files = [file_path for file_path, file_ids in zip(xml_files, collected)
+                         if file_ids is not None and not file_ids[2].isdisjoint(renamed_ids)]
+    # Any href that can change contains one of the renamed IDs, so one regex search rules out the rest
+    # before they are split, unquoted and resolved
+    renamed_id_pattern = re.compile('|'.join(map(re.escape, renamed_ids))) if renamed_ids else None
+    xml_files_set = set(xml_files)
+    updated_rel_paths = []
+    for file_path in referencing_files + ditamap_files:
         try:
-            tree = etree.parse(file_path)
+            tree = changed_trees.get(file_path)
+            if tree is None:
+                tree = etree.parse(file_path)
             modified = False
-            for elem in tree.xpath("//xref[@href]|//topicref[@href]"):
+            file_dir = os.path.dirname(file_path)
+            for elem in XPATH_REF_ELEMENTS(tree):
                 href = elem.get('href')
+                if renamed_id_pattern is None or not renamed_id_pattern.search(href):
+                    continue
                 new_href = href
                 if '#' in href and not href.startswith('#'):
                     filename, ref_id = href.split('#', 1)
                     filename = unquote(filename)
-                    abs_path = os.path.abspath(os.path.join(os.path.dirname(file_path), filename)).replace('\\', '/')
-                    if abs_path in xml_files:
-                        folder_name = os.path.basename(os.path.dirname(abs_path))
-                        mod_folder = os.path.basename(os.path.dirname(file_path))
-                        mod_file = os.path.basename(file_path)
+                    # file_dir is absolute, so normpath resolves the same path abspath would
+                    abs_path = os.path.normpath(os.path.join(file_dir, filename)).replace('\\', '/')
+                    if abs_path in xml_files_set:
                         if '/' in ref_id:
                             top_id, nested_id = ref_id.split('/', 1)
                             new_ref_id = ref_id
-                            if top_id in rename_map and abs_path in rename_map[top_id]:
-                                new_ref_id = f"{rename_map[top_id][abs_path]}/{nested_id}"
-                            if nested_id in rename_map and abs_path in rename_map[nested_id]:
-                                new_ref_id = f"{top_id if new_ref_id == ref_id else rename_map[top_id][abs_path]}/{rename_map[nested_id][abs_path]}"
+                            new_top_id = rename_map.get((abs_path, top_id))
+                            if new_top_id is not None:
+                                new_ref_id = f"{new_top_id}/{nested_id}"
+                            new_nested_id = rename_map.get((abs_path, nested_id))
+                            if new_nested_id is not None:
+                                new_ref_id = f"{top_id if new_top_id is None else new_top_id}/{new_nested_id}"
                             if new_ref_id != ref_id:
                                 new_href = f"{href.split('#', 1)[0]}#{new_ref_id}"
                         else:
-                            if ref_id in rename_map and abs_path in rename_map[ref_id]:
-                                new_ref_id = rename_map[ref_id][abs_path]
+                            new_ref_id = rename_map.get((abs_path, ref_id))
+                            if new_ref_id is not None:
                                 new_href = f"{href.split('#', 1)[0]}#{new_ref_id}"
                         if new_href != href:
                             elem.set('href', new_href)
@@ -237,20 +314,9 @@ def remove_duplicate_ids(parent: QWidget, dir_path: str = None) -> tuple[int, in
                 if not os.path.exists(backup_path):
                     os.makedirs(os.path.dirname(backup_path), exist_ok=True)
                     shutil.copy2(file_path, backup_path)
-                tree.write(file_path, encoding=tree.docinfo.encoding,
-                         doctype=tree.docinfo.doctype, pretty_print=False,
-                         xml_declaration=True)
-                files_modified += 1
-                # Log link changes with single header
-                if log_success:
-                    try:
-                        with open(log_file, 'a', encoding='utf-8') as f:
-                            if not header_written:
-                                f.write(f"-----------------------------\nUpdated XMLs for Ensuring Unique IDs:\n")
-                                header_written = True
-                            f.write(f"{rel_path} - Updated ID\n")
-                    except (OSError, PermissionError):
-                        log_success = False
+                changed_trees[file_path] = tree
+                change_counts[file_path] = change_counts.get(file_path, 0) + 1
+                updated_rel_paths.append((file_path, rel_path))
 
         except etree.LxmlError:
             continue
@@ -263,6 +329,44 @@ def remove_duplicate_ids(parent: QWidget, dir_path: str = None) -> tuple[int, in
                     pass
             continue
 
+    # Write each changed file once, through a temporary file replaced over it, so an interrupted write
+    # never leaves a truncated XML behind
+    files_modified = 0
+    written_files = set()
+    for file_path, tree in changed_trees.items():
+        temp_path = file_path + ".tmp"
+        try:
+            tree.write(temp_path, encoding=tree.docinfo.encoding,
+                     doctype=tree.docinfo.doctype, pretty_print=False,
+                     xml_declaration=True)
+            os.replace(temp_path, file_path)
+            written_files.add(file_path)
+            files_modified += change_counts[file_path]
+        except OSError:
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            if log_success:
+                try:
+                    with open(log_file, 'a', encoding='utf-8') as f:
+                        f.write(f"Error: File write failed {file_path}\n")
+                except (OSError, PermissionError):
+                    pass
+
+    # Log link changes with single header
+    for file_path, rel_path in updated_rel_paths:
+        if file_path in written_files and log_success:
+            try:
+                with open(log_file, 'a', encoding='utf-8') as f:
+                    if not header_written:
+                        f.write(f"-----------------------------\nUpdated XMLs for Ensuring Unique IDs:\n")
+                        header_written = True
+                    f.write(f"{rel_path} - Updated ID\n")
+            except (OSError, PermissionError):
+                log_success = False
+
     # Write summary
     if log_success:
         try:
@@ -2,9 +2,13 @@ import os
 from lxml import etree
 from urllib.parse import unquote
 import shutil
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import cpu_count
 
+# Compiled once and evaluated against every parsed file
+XPATH_MAP_HREFS = etree.XPath("//*[self::chapter or self::topicref or self::appendix][@href]/@href")
+XPATH_IMAGE_HREFS = etree.XPath("//image/@href")
+
 def _parse_xml_for_images(xml_path):
     """
     Parse a single XML file for image references.
@@ -18,7 +22,7 @@ def _parse_xml_for_images(xml_path):
     referenced_images = set()
     try:
         xml_tree = etree.parse(xml_path)
-        image_hrefs = xml_tree.xpath("//image/@href")
+        image_hrefs = XPATH_IMAGE_HREFS(xml_tree)
         for image_href in image_hrefs:
             image_path = os.path.normpath(os.path.join(os.path.dirname(xml_path), unquote(image_href)))
             if image_path.lower().endswith((".png", ".jpg", ".jpeg")):
@@ -47,16 +51,19 @@ def find_unreferenced_graphics(ditamap_path, directory_path, use_multiprocessing
     # Parse DITA map to get referenced XML files
     try:
         tree = etree.parse(ditamap_path)
-        xml_hrefs = tree.xpath("//*[self::chapter or self::topicref or self::appendix][@href]/@href")
+        xml_hrefs = XPATH_MAP_HREFS(tree)
         xml_hrefs = [unquote(href) for href in xml_hrefs if href and not href.startswith(('http://', 'https://', 'mailto:'))]
     except Exception as e:
         raise Exception(f"Error parsing DITA map: {str(e)}")
 
     # Collect XML files from all subdirectories, excluding LegacyTextTuring
     xml_files = []
-    for root, _, files in os.walk(directory_path):
+    for root, dirs, files in os.walk(directory_path):
         if 'LegacyTextTuring' in root.split(os.sep):
+            dirs[:] = []
             continue
+        # Prune LegacyTextTuring folders so os.walk never lists anything below them
+        dirs[:] = [d for d in dirs if d != 'LegacyTextTuring']
         for file in files:
             if file.endswith(".xml"):
                 xml_files.append(os.path.join(root, file))
@@ -73,14 +80,11 @@ def find_unreferenced_graphics(ditamap_path, directory_path, use_multiprocessing
         if use_multiprocessing and len(xml_files_to_parse) > 1:
             # Use multiprocessing for better performance
             max_workers = min(cpu_count(), len(xml_files_to_parse))
+            # Hand each worker several XML files per round-trip instead of one
+            chunksize = max(1, len(xml_files_to_parse) // (max_workers * 4))
             with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                futures = {executor.submit(_parse_xml_for_images, xml_path): xml_path for xml_path in xml_files_to_parse}
-                for future in as_completed(futures):
-                    try:
-                        images = future.result()
-                        referenced_images.update(images)
-                    except Exception:
-                        pass  # Skip files that cause errors
+                for images in executor.map(_parse_xml_for_images, xml_files_to_parse, chunksize=chunksize):
+                    referenced_images.update(images)
         else:
             # Single-threaded processing
             for xml_path in xml_files_to_parse:
@@ -90,9 +94,11 @@ def find_unreferenced_graphics(ditamap_path, directory_path, use_multiprocessing
     # Collect PNG, JPG, and JPEG files from Graphics folder, excluding LegacyTextTuring
     graphics_dir = os.path.join(directory_path, "Graphics")
     if os.path.exists(graphics_dir):
-        for root, _, files in os.walk(graphics_dir):
+        for root, dirs, files in os.walk(graphics_dir):
             if 'LegacyTextTuring' in root.split(os.sep):
+                dirs[:] = []
                 continue
+            dirs[:] = [d for d in dirs if d != 'LegacyTextTuring']
             for file in files:
                 if file.lower().endswith((".png", ".jpg", ".jpeg")):
                     full_path = os.path.join(root, file)
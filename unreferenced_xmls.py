@@ -3,6 +3,9 @@ from lxml import etree
 from urllib.parse import unquote
 import shutil
 
+# Compiled once and evaluated against the DITA map
+XPATH_MAP_HREFS = etree.XPath("//*[self::chapter or self::topicref or self::appendix][@href]/@href")
+
 def find_unreferenced_xmls(ditamap_path, directory_path):
     """
     Find XML files in the directory that are not referenced in the DITA map, excluding LegacyTextTuring.
@@ -21,7 +24,7 @@ def find_unreferenced_xmls(ditamap_path, directory_path):
     # Parse DITA map to get referenced files
     try:
         tree = etree.parse(ditamap_path)
-        hrefs = tree.xpath("//*[self::chapter or self::topicref or self::appendix][@href]/@href")
+        hrefs = XPATH_MAP_HREFS(tree)
         ditamap_dir = os.path.dirname(ditamap_path)
         for href in hrefs:
             if href.startswith(('http://', 'https://', 'mailto:')):
@@ -34,9 +37,12 @@ def find_unreferenced_xmls(ditamap_path, directory_path):
         raise Exception(f"Error parsing DITA map: {str(e)}")
 
     # Collect XML files, excluding LegacyTextTuring
-    for root, _, files in os.walk(directory_path):
+    for root, dirs, files in os.walk(directory_path):
         if 'LegacyTextTuring' in root.split(os.sep):
+            dirs[:] = []
             continue
+        # Prune LegacyTextTuring folders so os.walk never lists anything below them
+        dirs[:] = [d for d in dirs if d != 'LegacyTextTuring']
         for file in files:
             if file.endswith(".xml"):
                 full_path = os.path.join(root, file)
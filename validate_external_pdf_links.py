@@ -121,7 +121,7 @@ def extract_links(doc, use_multiprocessing=True):
             completed_pages = 0
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 # Submit all tasks
-                futures = {executor.submit(process_page_optimized, task): task for task in page_tasks}
+                futures = [executor.submit(process_page_optimized, task) for task in page_tasks]
                 
                 # Process results as they complete
                 for future in as_completed(futures):